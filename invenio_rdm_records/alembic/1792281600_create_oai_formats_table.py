@@ -0,0 +1,46 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create precomputed OAI-PMH formats table."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy_utils.types import UUIDType
+
+# revision identifiers, used by Alembic.
+revision = "1792281600"
+down_revision = "1746626978"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_records_oai_formats",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("record_id", UUIDType(), nullable=False),
+        sa.Column("metadata_format", sa.String(length=255), nullable=False),
+        sa.Column("revision_id", sa.Integer(), nullable=False),
+        sa.Column("source_checksum", sa.String(length=64), nullable=False),
+        sa.Column("xml", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["rdm_records_metadata.id"],
+            name=op.f("fk_rdm_records_oai_formats_record_id_rdm_records_metadata"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "record_id", "metadata_format", name=op.f("pk_rdm_records_oai_formats")
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("rdm_records_oai_formats")
@@ -9,11 +9,20 @@
 
 """Command-line tools for demo module."""
 
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
 import click
 from flask import current_app
 from flask.cli import with_appcontext
 from invenio_access.permissions import system_identity
 from invenio_communities import current_communities
+from invenio_db import db
 from invenio_records_resources.proxies import current_service_registry
 from invenio_records_resources.services.custom_fields.errors import (
     CustomFieldsException,
@@ -305,42 +314,227 @@ def add_to_fixture(fixture):
     click.secho("Sent all entry additions and updates to celery!", fg="green")
 
 
-@rdm_records.command("rebuild-index")
-@with_appcontext
-def rebuild_index():
-    """Reindex all drafts, records and vocabularies."""
-    click.secho("Reindexing vocabularies...", fg="green")
-    vocab_service = current_service_registry.get("vocabularies")
-    vocab_service.rebuild_index(identity=system_identity)
-
-    click.secho("Reindexing names...", fg="green")
-    names_service = current_service_registry.get("names")
-    names_service.rebuild_index(identity=system_identity)
-
-    click.secho("Reindexing funders...", fg="green")
-    funders_service = current_service_registry.get("funders")
-    funders_service.rebuild_index(identity=system_identity)
-
-    click.secho("Reindexing awards...", fg="green")
-    awards_service = current_service_registry.get("awards")
-    awards_service.rebuild_index(identity=system_identity)
+REBUILD_INDEX_TARGETS = [
+    "vocabularies",
+    "names",
+    "funders",
+    "awards",
+    "subjects",
+    "affiliations",
+    "records",
+    "oai-sets",
+]
+"""Targets of the ``rebuild-index`` command, in the order they are reindexed."""
+
+# application used by the rebuild-index worker processes (inherited on fork)
+_worker_app = None
+
+
+def _init_rebuild_index_worker():
+    """Initialize a rebuild-index worker process."""
+    with _worker_app.app_context():
+        # do not reuse the database connections of the parent process
+        db.engine.dispose(close=False)
+
+
+def _index_chunk(kind, record_ids):
+    """Index a chunk of records or drafts, in a worker process."""
+    with _worker_app.app_context():
+        service = current_rdm_records.records_service
+        indexer = service.draft_indexer if kind == "drafts" else service.indexer
+        return indexer.index_ids(
+            record_ids, search_bulk_kwargs={"raise_on_error": False}
+        )
 
-    click.secho("Reindexing subjects...", fg="green")
-    subj_service = current_service_registry.get("subjects")
-    subj_service.rebuild_index(identity=system_identity)
 
-    click.secho("Reindexing affiliations...", fg="green")
-    affs_service = current_service_registry.get("affiliations")
-    affs_service.rebuild_index(identity=system_identity)
+def _load_checkpoint(path):
+    """Load the rebuild-index checkpoint, if any."""
+    try:
+        with open(path) as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+
+
+def _save_checkpoint(path, checkpoint):
+    """Atomically save the rebuild-index checkpoint."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as fp:
+        json.dump(checkpoint, fp)
+    os.replace(tmp_path, path)
+
+
+def _iter_id_chunks(query, id_column, chunk_size, last_id=None):
+    """Iterate over the IDs of a query in chunks, using keyset pagination."""
+    while True:
+        chunk_query = query
+        if last_id:
+            chunk_query = chunk_query.filter(id_column > last_id)
+        ids = [
+            str(row.id)
+            for row in chunk_query.order_by(id_column).limit(chunk_size).all()
+        ]
+        if not ids:
+            break
+        yield ids
+        last_id = ids[-1]
+
+
+def _rebuild_records_index(kind, since, chunk_size, workers, checkpoint, save):
+    """Reindex the records or drafts, reporting the progress."""
+    service = current_rdm_records.records_service
+    if kind == "drafts":
+        model_cls, indexer = service.draft_cls.model_cls, service.draft_indexer
+    else:
+        model_cls, indexer = service.record_cls.model_cls, service.indexer
+
+    query = db.session.query(model_cls.id).filter(model_cls.is_deleted == False)
+    if since:
+        query = query.filter(model_cls.updated >= since)
+
+    last_id = checkpoint.get(kind)
+    total = query.count()
+    done = total
+    if last_id:
+        done -= query.filter(model_cls.id > last_id).count()
+    start_done, start_time = done, time.monotonic()
+
+    def progress(chunk):
+        nonlocal done
+        done += len(chunk)
+        checkpoint[kind] = chunk[-1]
+        save()
+        rate = (done - start_done) / max(time.monotonic() - start_time, 1e-6)
+        eta = timedelta(seconds=int((total - done) / rate)) if rate else "?"
+        click.echo(f"  {kind}: {done}/{total} ({rate:.1f} docs/s, ETA {eta})")
+
+    chunks = _iter_id_chunks(query, model_cls.id, chunk_size, last_id=last_id)
+    errors = 0
+    if not workers:
+        # send the records to the bulk indexing queue
+        for chunk in chunks:
+            indexer.bulk_index(chunk)
+            progress(chunk)
+        return errors
+
+    global _worker_app
+    _worker_app = current_app._get_current_object()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_rebuild_index_worker,
+    ) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(_index_chunk, kind, chunk)))
+            # chunks are checkpointed in order, so that resuming never skips any
+            while len(pending) > 2 * workers or (pending and pending[0][1].done()):
+                done_chunk, future = pending.popleft()
+                errors += future.result()[1]
+                progress(done_chunk)
+        for done_chunk, future in pending:
+            errors += future.result()[1]
+            progress(done_chunk)
+    return errors
 
-    click.secho("Reindexing records and drafts...", fg="green")
-    rec_service = current_rdm_records.records_service
-    rec_service.rebuild_index(identity=system_identity)
 
-    click.secho("Reindexing OAI sets...", fg="green")
-    oaipmh_service = current_rdm_records.oaipmh_server_service
-    oaipmh_service.rebuild_index(identity=system_identity)
+@rdm_records.command("rebuild-index")
+@click.option(
+    "--only",
+    multiple=True,
+    type=click.Choice(REBUILD_INDEX_TARGETS),
+    help="Only reindex the given target (can be repeated).",
+)
+@click.option(
+    "--since",
+    type=click.DateTime(),
+    help="Only reindex the records and drafts updated since the given date.",
+)
+@click.option(
+    "--chunk-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of records and drafts indexed per chunk.",
+)
+@click.option(
+    "--workers",
+    default=0,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of processes indexing the records and drafts directly. "
+    "If 0, they are sent to the bulk indexing queue instead.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False),
+    help="Checkpoint file (default: rdm-rebuild-index.json in the instance path).",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Resume an interrupted rebuild from its checkpoint.",
+)
+@with_appcontext
+def rebuild_index(only, since, chunk_size, workers, checkpoint_path, resume):
+    """Reindex all drafts, records and vocabularies."""
+    checkpoint_path = checkpoint_path or os.path.join(
+        current_app.instance_path, "rdm-rebuild-index.json"
+    )
+    checkpoint = _load_checkpoint(checkpoint_path) if resume else {}
+    if resume and checkpoint:
+        click.secho(f"Resuming from checkpoint {checkpoint_path}", fg="yellow")
+        only = only or checkpoint.get("only", [])
+        since = since or (
+            datetime.fromisoformat(checkpoint["since"])
+            if checkpoint.get("since")
+            else None
+        )
+    checkpoint.update(
+        {
+            "only": list(only),
+            "since": since.isoformat() if since else None,
+            "done": checkpoint.get("done", []),
+        }
+    )
 
+    def save():
+        _save_checkpoint(checkpoint_path, checkpoint)
+
+    for target in REBUILD_INDEX_TARGETS:
+        if only and target not in only:
+            continue
+        if target in checkpoint["done"]:
+            click.secho(f"Skipping {target} (already reindexed)...", fg="yellow")
+            continue
+
+        start_time = time.monotonic()
+        if target == "records":
+            click.secho("Reindexing records and drafts...", fg="green")
+            errors = 0
+            for kind in ("records", "drafts"):
+                errors += _rebuild_records_index(
+                    kind, since, chunk_size, workers, checkpoint, save
+                )
+            if errors:
+                click.secho(f"Failed to index {errors} records/drafts.", fg="red")
+        elif target == "oai-sets":
+            click.secho("Reindexing OAI sets...", fg="green")
+            oaipmh_service = current_rdm_records.oaipmh_server_service
+            oaipmh_service.rebuild_index(identity=system_identity)
+        else:
+            click.secho(f"Reindexing {target}...", fg="green")
+            service = current_service_registry.get(target)
+            service.rebuild_index(identity=system_identity)
+
+        checkpoint["done"].append(target)
+        save()
+        elapsed = timedelta(seconds=int(time.monotonic() - start_time))
+        click.echo(f"  {target} done in {elapsed}")
+
+    os.remove(checkpoint_path)
     click.secho("Reindexed records and vocabularies!", fg="green")
 
 
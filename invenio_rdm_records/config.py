@@ -153,6 +153,19 @@ RDM_DEFAULT_FILES_ENABLED = True
 RDM_ALLOW_RESTRICTED_RECORDS = True
 """Allow users to set restricted/private records."""
 
+RDM_PERMISSION_NEEDS_CACHE_ENABLED = True
+"""Memoize the permission needs of the record generators for each request."""
+
+RDM_SECRET_LINKS_CACHE_TTL = 0
+"""Time (in seconds) the permissions of secret links are cached across requests.
+
+The permissions of the secret links are always cached for the duration of a
+request. If set, they are also cached in-process across requests, which avoids
+querying them for each record permission check. Updated or revoked links are
+invalidated in the current process only, other processes may use the cached
+permissions until they expire.
+"""
+
 #
 # Record deletion by users
 #
@@ -389,6 +402,39 @@ RDM_SEARCH_VERSIONING = {
 }
 """Records versions search configuration (list of versions for a record)."""
 
+RDM_RECORDS_CSV_EXPORT_FIELDS = [
+    "id",
+    "created",
+    "pids.doi.identifier",
+    "metadata.title",
+    "metadata.description",
+    "metadata.resource_type.title.en",
+    "metadata.publication_date",
+    "metadata.creators.person_or_org.type",
+    "metadata.creators.person_or_org.name",
+    "metadata.rights.id",
+]
+"""Columns of the streamed CSV export of the search results.
+
+The columns are fixed, so that the rows can be written while the records are
+being fetched. They are projected directly from the search index, thus only
+fields of the ``id``, ``created``, ``updated``, ``pids``, ``metadata`` and
+``custom_fields`` of the records are supported.
+"""
+
+RDM_VOCABULARY_PROPS_CACHE_TTL = 600
+"""Time (in seconds) the vocabulary props used by the serializers are cached.
+
+Each process loads a whole vocabulary type at once and keeps it in memory for
+this long. Set it to ``0`` to disable the cache.
+"""
+
+RDM_VOCABULARY_PROPS_CACHE_MAX_ITEMS = 10000
+"""Maximum number of items of a vocabulary type loaded at once in the cache.
+
+Items of larger vocabularies which are not loaded are looked up one by one.
+"""
+
 #
 # OAI-PMH Search configuration
 #
@@ -515,6 +561,35 @@ RDM_OPTIONAL_DOI_VALIDATOR = validate_optional_doi
 Check the signature of validate_optional_doi for more information.
 """
 
+RDM_PIDS_BATCH_ENABLED = False
+"""Batch the registration/update of PIDs on the remote providers.
+
+Instead of one task per record and PID scheme, the pending registrations and
+updates are sent to a queue and coalesced per record and PID. The queue has to
+be processed periodically, e.g.:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        "rdm-records-pids": {
+            "task": "invenio_rdm_records.services.pids.tasks.process_pid_updates",
+            "schedule": timedelta(seconds=30),
+        },
+    }
+"""
+
+RDM_PIDS_BATCH_SIZE = 1000
+"""Maximum number of queued PID updates processed per batch."""
+
+RDM_PIDS_BATCH_CONCURRENCY = 4
+"""Number of PIDs registered/updated concurrently when processing a batch."""
+
+RDM_PIDS_BATCH_MAX_RETRIES = 5
+"""Number of times a failed PID registration/update is queued again.
+
+Once exceeded, the failure is logged as an error and the update is dropped.
+"""
+
 
 # Configuration for the DataCiteClient used by the DataCitePIDProvider
 
@@ -548,6 +623,15 @@ You can also provide a callable instead:
     DATACITE_FORMAT = make_doi
 """
 
+DATACITE_POOL_MAXSIZE = 10
+"""Maximum number of pooled connections to the DataCite REST API."""
+
+DATACITE_MAX_RETRIES = 5
+"""Number of retries of rate-limited or failed DataCite REST API requests."""
+
+DATACITE_BACKOFF_FACTOR = 0.5
+"""Backoff factor (in seconds) between retries of DataCite REST API requests."""
+
 DATACITE_DATACENTER_SYMBOL = ""
 """DataCite data center symbol.
 
@@ -717,6 +801,35 @@ RDM_IIIF_MANIFEST_FORMATS = [
 ]
 """Formats to be included in the IIIF Manifest."""
 
+RDM_OAI_FORMATS_CACHE_ENABLED = False
+"""Precompute the OAI-PMH serializations of records when they are indexed.
+
+The serializations are stored in a separate table and served by the OAI-PMH
+format functions as long as the indexed record hasn't changed, which makes
+harvests mostly I/O-bound. Requires a running Celery worker.
+"""
+
+RDM_IIIF_IMAGE_CACHE_ENABLED = True
+"""Enable caching the image derivatives served by the IIIF image API.
+
+The derivatives are stored via the Flask-IIIF cache handler, configured with
+``IIIF_CACHE_HANDLER``. Besides the handlers of Flask-IIIF (in-memory and Redis),
+``invenio_rdm_records.services.iiif.cache:ImageFileSystemCache`` and
+``invenio_rdm_records.services.iiif.cache:ImageLRUCache`` can be used.
+"""
+
+RDM_IIIF_CACHE_FILESYSTEM_PATH = "iiif-cache/"
+"""Directory of the filesystem IIIF cache handler.
+
+Relative paths are resolved against the application instance path.
+"""
+
+RDM_IIIF_CACHE_FILESYSTEM_THRESHOLD = 10000
+"""Maximum number of entries in the filesystem IIIF cache handler."""
+
+RDM_IIIF_CACHE_LRU_MAX_SIZE = 256 * 1024 * 1024
+"""Maximum total size (in bytes) of the in-memory LRU IIIF cache handler."""
+
 #
 # IIIF Tiles configuration
 #
@@ -754,3 +867,11 @@ RDM_RECORDS_RESTRICTION_GRACE_PERIOD = timedelta(days=30)
 
 RDM_RECORDS_ALLOW_RESTRICTION_AFTER_GRACE_PERIOD = False
 """Whether record access restriction is allowed after the grace period or not."""
+
+RDM_EMBARGO_LIFT_CHUNK_SIZE = 100
+"""Number of records whose expired embargo is lifted per transaction.
+
+The records of a chunk are reindexed in bulk. The drafts of the records are
+still indexed one by one, and the DOI updates are only coalesced if
+``RDM_PIDS_BATCH_ENABLED`` is set (one task per record and DOI otherwise).
+"""
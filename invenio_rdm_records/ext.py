@@ -48,6 +48,7 @@ from .resources.config import (
     RDMRecordMediaFilesResourceConfig,
 )
 from .resources.resources import RDMRecordCommunitiesResource, RDMRecordRequestsResource
+from .resources.serializers.registry import SerializersRegistry
 from .services import (
     CommunityRecordsService,
     IIIFService,
@@ -101,6 +102,7 @@ class InvenioRDMRecords(object):
         self.init_config(app)
         self.init_services(app)
         self.init_resource(app)
+        self.serializers = SerializersRegistry()
         app.extensions["invenio-rdm-records"] = self
         app.register_blueprint(blueprint)
         # Load flask IIIF
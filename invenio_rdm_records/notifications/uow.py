@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for notifications."""
+
+from invenio_notifications.tasks import broadcast_notification
+from invenio_records_resources.services.uow import Operation
+
+
+class NotificationBulkOp(Operation):
+    """Broadcast a batch of notifications after the transaction commit.
+
+    Contrary to ``NotificationOp``, which spawns one broadcast task per
+    notification, the notifications are broadcasted in chunks of
+    ``chunk_size`` notifications per task.
+    """
+
+    def __init__(self, notifications, chunk_size=100):
+        """Initialize the operation."""
+        super().__init__()
+        self._notifications = notifications
+        self._chunk_size = chunk_size
+
+    def on_post_commit(self, uow):
+        """Start the tasks to broadcast the notifications."""
+        if not self._notifications:
+            return
+
+        broadcast_notification.chunks(
+            [(notification.dumps(),) for notification in self._notifications],
+            self._chunk_size,
+        ).apply_async()
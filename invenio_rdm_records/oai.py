@@ -8,9 +8,14 @@
 
 """Invenio-RDM-Records OAI Functionality."""
 
+import hashlib
+import json
+from functools import wraps
+
 from datacite import schema43
 from dcxml import simpledc
 from flask import current_app, g
+from invenio_db import db
 from invenio_pidstore.errors import PersistentIdentifierError, PIDDoesNotExistError
 from invenio_pidstore.fetchers import FetchedPID
 from invenio_pidstore.models import PersistentIdentifier
@@ -18,8 +23,10 @@ from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_search import RecordsSearch
 from invenio_search.engine import dsl
 from lxml import etree
+from werkzeug.utils import import_string
 
 from .proxies import current_rdm_records, current_rdm_records_service
+from .records.models import RDMRecordOAIFormat
 from .resources.serializers.datacite import DataCite43XMLSerializer
 from .resources.serializers.dcat import DCATSerializer
 from .resources.serializers.dublincore import DublinCoreXMLSerializer
@@ -27,45 +34,135 @@ from .resources.serializers.marcxml import MARCXMLSerializer
 from .services.pids.providers.oai import OAIPIDProvider
 
 
+def _source_checksum(source):
+    """Compute the checksum of an indexed record.
+
+    The statistics are left out, as they change independently of the metadata.
+    """
+    data = {k: v for k, v in source.items() if k != "stats"}
+    dumped = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+
+
+def cached_oai_format(func):
+    """Serve the precomputed serialization of a record, if it is up to date.
+
+    The serializations are computed when the record is indexed, if the
+    ``RDM_OAI_FORMATS_CACHE_ENABLED`` configuration is set. Otherwise, or if the
+    indexed record has changed since, the record is serialized on the fly.
+    """
+
+    @wraps(func)
+    def wrapper(pid, record, **serializer_kwargs):
+        if (
+            not serializer_kwargs
+            and current_app.config.get("RDM_OAI_FORMATS_CACHE_ENABLED", False)
+            and "uuid" in record["_source"]
+        ):
+            source = record["_source"]
+            cached = RDMRecordOAIFormat.query.filter_by(
+                record_id=source["uuid"],
+                metadata_format=func.__name__,
+                source_checksum=_source_checksum(source),
+            ).one_or_none()
+            if cached is not None:
+                return etree.fromstring(cached.xml.encode("utf-8"))
+        return func(pid, record, **serializer_kwargs)
+
+    return wrapper
+
+
+def precompute_oai_formats(record):
+    """Serialize a record into all the configured OAI-PMH metadata formats.
+
+    Only the format functions decorated with ``cached_oai_format`` and without
+    extra serializer arguments are taken into account.
+    """
+    source = record.dumps()
+    hit = {"_id": str(record.id), "_source": source}
+    checksum = _source_checksum(source)
+
+    existing = {
+        row.metadata_format: row
+        for row in RDMRecordOAIFormat.query.filter_by(record_id=record.id)
+    }
+    for metadata_format in current_app.config["OAISERVER_METADATA_FORMATS"].values():
+        serializer = metadata_format["serializer"]
+        if not isinstance(serializer, str):
+            continue
+        serializer = import_string(serializer)
+        func = getattr(serializer, "__wrapped__", None)
+        if func is None:
+            continue
+
+        row = existing.get(func.__name__)
+        if row is not None and row.source_checksum == checksum:
+            continue
+        if row is None:
+            row = RDMRecordOAIFormat(record_id=record.id, metadata_format=func.__name__)
+            existing[func.__name__] = row
+            db.session.add(row)
+
+        row.revision_id = record.revision_id
+        row.source_checksum = checksum
+        row.xml = etree.tostring(func(None, hit), encoding="unicode")
+
+
+def _oai_result_dict(record):
+    """Get the projected result item of a record search hit.
+
+    The projection is computed once per request for each record revision, and
+    shared between the metadata formats.
+    """
+    source = record["_source"]
+    key = (source["id"], source.get("version_id"))
+    result_dicts = g.setdefault("rdm_oai_result_dicts", {})
+    if key not in result_dicts:
+        item = current_rdm_records_service.oai_result_item(g.identity, source)
+        result_dicts[key] = item.to_dict()
+    return result_dicts[key]
+
+
+@cached_oai_format
 def dublincore_etree(pid, record, **serializer_kwargs):
     """Get DublinCore XML etree for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
     # TODO: DublinCoreXMLSerializer should be able to dump an etree directly
     # instead. See https://github.com/inveniosoftware/flask-resources/issues/117
-    obj = DublinCoreXMLSerializer(**serializer_kwargs).dump_obj(item.to_dict())
+    if serializer_kwargs:
+        serializer = DublinCoreXMLSerializer(**serializer_kwargs)
+    else:
+        serializer = current_rdm_records.serializers.get(DublinCoreXMLSerializer)
+    obj = serializer.dump_obj(_oai_result_dict(record))
     return simpledc.dump_etree(obj)
 
 
+@cached_oai_format
 def marcxml_etree(pid, record):
     """OAI MARCXML format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: MARCXMLSerializer should directly be able to dump an etree instead
-    # of internally creating an etree, then dump to xml, then parse into an
-    # etree. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        MARCXMLSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
+    serializer = current_rdm_records.serializers.get(MARCXMLSerializer)
+    return serializer.dump_etree(_oai_result_dict(record))
 
 
+@cached_oai_format
 def dcat_etree(pid, record):
     """OAI DCAT-AP format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        DCATSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
+    serializer = current_rdm_records.serializers.get(DCATSerializer)
+    return serializer.dump_etree(_oai_result_dict(record))
 
 
+@cached_oai_format
 def datacite_etree(pid, record):
     """DataCite XML format for OAI-PMH.
 
     It assumes that record is a search result.
     """
     # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    data_dict = DataCite43XMLSerializer().dump_obj(record["_source"])
+    serializer = current_rdm_records.serializers.get(DataCite43XMLSerializer)
+    data_dict = serializer.dump_obj(record["_source"])
     return schema43.dump_etree(data_dict)
 
 
+@cached_oai_format
 def oai_datacite_etree(pid, record):
     """OAI DataCite XML format for OAI-PMH.
 
@@ -73,7 +170,8 @@ def oai_datacite_etree(pid, record):
     """
     # TODO: See https://github.com/inveniosoftware/flask-resources/issues/117
     # This should be made into a serializer similar to the ones above.
-    resource_dict = DataCite43XMLSerializer().dump_obj(record["_source"])
+    serializer = current_rdm_records.serializers.get(DataCite43XMLSerializer)
+    resource_dict = serializer.dump_obj(record["_source"])
 
     nsmap = {
         None: "http://schema.datacite.org/oai/oai-1.1/",
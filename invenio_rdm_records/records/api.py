@@ -8,7 +8,7 @@
 
 """RDM Record and Draft API."""
 
-from flask import current_app, g
+from flask import current_app, g, has_app_context
 from invenio_access.permissions import system_user_id
 from invenio_communities.records.records.systemfields import CommunitiesField
 from invenio_db import db
@@ -21,7 +21,6 @@ from invenio_pidstore.models import PIDStatus
 from invenio_records.dumpers import SearchDumper
 from invenio_records.dumpers.relations import RelationDumperExt
 from invenio_records.systemfields import ConstantField, DictField, ModelField
-from invenio_records.systemfields.relations import MultiRelationsField
 from invenio_records_resources.records.api import FileRecord
 from invenio_records_resources.records.dumpers import CustomFieldsDumperExt
 from invenio_records_resources.records.systemfields import (
@@ -41,6 +40,8 @@ from invenio_vocabularies.contrib.funders.api import Funder
 from invenio_vocabularies.contrib.subjects.api import Subject
 from invenio_vocabularies.records.api import Vocabulary
 from invenio_vocabularies.records.systemfields.relations import CustomFieldsRelation
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from invenio_rdm_records.records.systemfields.deletion_status import (
     RecordDeletionStatusEnum,
@@ -59,6 +60,7 @@ from .systemfields import (
     HasDraftCheckField,
     IsVerifiedField,
     ParentRecordAccessField,
+    RDMMultiRelationsField,
     RecordAccessField,
     RecordDeletionStatusField,
     RecordStatisticsField,
@@ -126,7 +128,7 @@ class CommonFieldsMixin:
         ]
     )
 
-    relations = MultiRelationsField(
+    relations = RDMMultiRelationsField(
         creator_affiliations=PIDNestedListRelation(
             "metadata.creators",
             relation_field="affiliations",
@@ -306,6 +308,94 @@ class RDMMediaFileDraft(FileRecord):
     processor = DictField(clear_none=True, create_if_missing=True)
 
 
+def _get_quotas_cache():
+    """Get the files quotas cache of the current request/task."""
+    if "rdm_records_files_quotas" not in g:
+        g.rdm_records_files_quotas = {"parents": {}, "users": {}}
+    return g.rdm_records_files_quotas
+
+
+def clear_files_quotas_cache(*args, **kwargs):
+    """Clear the files quotas cache of the current request/task.
+
+    It is cleared whenever a quota is changed or the transaction is rolled back.
+    """
+    if has_app_context():
+        g.pop("rdm_records_files_quotas", None)
+
+
+for _model_cls in (models.RDMRecordQuota, models.RDMUserQuota):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model_cls, _event, clear_files_quotas_cache)
+event.listen(Session, "after_soft_rollback", clear_files_quotas_cache)
+
+
+def _quota_to_dict(quota):
+    """Serialize a quota model for the cache."""
+    if quota is None:
+        return None
+    return dict(quota_size=quota.quota_size, max_file_size=quota.max_file_size)
+
+
+def _resolve_user_quotas(user_ids):
+    """Resolve the quotas of many users at once, using the cache."""
+    cache = _get_quotas_cache()["users"]
+    user_ids = {
+        str(user_id): user_id
+        for user_id in user_ids
+        if user_id is not None and user_id != system_user_id
+    }
+    missing = user_ids.keys() - cache.keys()
+    if missing:
+        quotas = models.RDMUserQuota.query.filter(
+            models.RDMUserQuota.user_id.in_([user_ids[key] for key in missing])
+        )
+        for key in missing:
+            cache[key] = None
+        for quota in quotas:
+            cache[str(quota.user_id)] = _quota_to_dict(quota)
+    return {key: cache[key] for key in user_ids}
+
+
+def resolve_quotas(parents):
+    """Resolve the files quotas of many parent records at once.
+
+    The record quotas and then the owner quotas of all the parents are fetched
+    with one query each, and cached for the rest of the request/task so that
+    ``get_files_quota`` does not query them again.
+
+    :param parents: Iterable of parent records.
+    :returns: dict mapping each parent ID to its quota dict (i.e.
+        ``{quota_size, max_file_size}``), or to ``None`` if the default quota
+        applies.
+    """
+    parents = list(parents)
+    cache = _get_quotas_cache()["parents"]
+
+    missing = {parent.id for parent in parents} - cache.keys()
+    if missing:
+        quotas = models.RDMRecordQuota.query.filter(
+            models.RDMRecordQuota.parent_id.in_(missing)
+        )
+        for parent_id in missing:
+            cache[parent_id] = None
+        for quota in quotas:
+            cache[quota.parent_id] = _quota_to_dict(quota)
+
+    # fall back to the quota of the owners
+    owners = {
+        parent.id: parent.access.owned_by.owner_id
+        for parent in parents
+        if cache[parent.id] is None
+    }
+    user_quotas = _resolve_user_quotas(owners.values())
+
+    return {
+        parent.id: cache[parent.id] or user_quotas.get(str(owners.get(parent.id)))
+        for parent in parents
+    }
+
+
 def get_files_quota(record=None):
     """Called by the file manager in create_bucket() during record.post_create.
 
@@ -318,6 +408,8 @@ def get_files_quota(record=None):
         - current identity quota is checked
         - default quota
 
+    The quotas are cached for the current request/task, see ``resolve_quotas``.
+
     Note: The files manager initialization runs before any service components
           (including the access component which initializes the ownership info)
           causing the quota to not be picked up correctly here for new drafts.
@@ -329,39 +421,13 @@ def get_files_quota(record=None):
     """
     if record is not None:
         assert getattr(record, "parent", None)
-        # Check record quota
-        record_quota = models.RDMRecordQuota.query.filter(
-            models.RDMRecordQuota.parent_id == record.parent.id
-        ).one_or_none()
-        if record_quota is not None:
-            return dict(
-                quota_size=record_quota.quota_size,
-                max_file_size=record_quota.max_file_size,
-            )
-        # Next user quota
-        owner_id = record.parent.access.owned_by.owner_id
-        if owner_id == system_user_id:
-            user_quota = None
-        else:
-            user_quota = models.RDMUserQuota.query.filter(
-                models.RDMUserQuota.user_id == owner_id
-            ).one_or_none()
-
-        if user_quota is not None:
-            return dict(
-                quota_size=user_quota.quota_size,
-                max_file_size=user_quota.max_file_size,
-            )
+        quota = resolve_quotas([record.parent])[record.parent.id]
     else:
         # check current user quota
-        user_quota = models.RDMUserQuota.query.filter(
-            models.RDMUserQuota.user_id == g.identity.id
-        ).one_or_none()
-        if user_quota is not None:
-            return dict(
-                quota_size=user_quota.quota_size,
-                max_file_size=user_quota.max_file_size,
-            )
+        quota = _resolve_user_quotas([g.identity.id]).get(str(g.identity.id))
+
+    if quota is not None:
+        return dict(quota)
 
     # the config variables if not set are mapped to FILES_REST_DEFAULT_QUOTA_SIZE,
     # FILES_REST_DEFAULT_MAX_FILE_SIZE respectively
@@ -541,6 +607,30 @@ class RDMRecord(CommonFieldsMixin, Record):
                 else None
             )
 
+    @classmethod
+    def get_published_pids_by_parent(cls, parent, scheme):
+        """Get the PIDs of a scheme of the published versions of a parent record.
+
+        The PIDs are fetched from the database in a single query, from the latest
+        to the first version, skipping the versions without a PID of the scheme.
+
+        :param parent: parent record.
+        :param scheme: PID scheme, e.g. ``doi``.
+        :returns: A list of PID dictionaries (i.e. with ``identifier``,
+            ``provider`` and ``client`` keys).
+        """
+        with db.session.no_autoflush:
+            query = (
+                db.session.query(cls.model_cls.json["pids"][scheme])
+                .filter(
+                    cls.model_cls.parent_id == parent.id,
+                    cls.model_cls.deletion_status
+                    == RecordDeletionStatusEnum.PUBLISHED.value,
+                )
+                .order_by(cls.model_cls.index.desc())
+            )
+            return [pid for (pid,) in query if pid]
+
     @classmethod
     def get_latest_published_by_parent(cls, parent):
         """Get the latest published record for the specified parent record.
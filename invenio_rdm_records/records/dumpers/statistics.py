@@ -7,7 +7,7 @@
 
 """Search dumpers for access-control information."""
 
-from flask import current_app
+from flask import current_app, g
 from invenio_records.dictutils import dict_lookup, parse_lookup_key
 from invenio_records.dumpers import SearchDumperExt
 
@@ -21,8 +21,15 @@ class StatisticsDumperExt(SearchDumperExt):
     queries and dumps them into a field so that they are indexed in the search engine.
     On load, it keeps the dumped values in the data dictionary, in order to enable
     the record schema to dump them if present.
+
+    When indexing many records at once, the statistics can be fetched for all of
+    them upfront via ``prefetch()``, in which case the dump doesn't query the
+    statistics indices anymore.
     """
 
+    #: Key on the application context globals for the prefetched statistics.
+    prefetch_key = "rdm_records_prefetched_stats"
+
     def __init__(self, target_field):
         """Constructor.
 
@@ -42,12 +49,27 @@ class StatisticsDumperExt(SearchDumperExt):
 
         try:
             parent_data = dict_lookup(data, self.keys, parent=True)
-            parent_data[self.key] = Statistics.get_record_stats(
+            stats = g.get(self.prefetch_key, {}).pop(recid, None)
+            parent_data[self.key] = stats or Statistics.get_record_stats(
                 recid=recid, parent_recid=parent_recid
             )
         except KeyError as e:
             current_app.logger.warning(e)
 
+    @classmethod
+    def prefetch(cls, pairs):
+        """Fetch the statistics for many records to be dumped in the same context.
+
+        :param pairs: Iterable of ``(recid, parent_recid)`` tuples.
+        """
+        prefetched = g.setdefault(cls.prefetch_key, {})
+        prefetched.update(Statistics.get_records_stats(pairs))
+
+    @classmethod
+    def clear_prefetched(cls):
+        """Discard the prefetched statistics that haven't been dumped."""
+        g.pop(cls.prefetch_key, None)
+
     def load(self, data, record_cls):
         """Keep the download & view statistics in the data dictionary.
 
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search indexers for RDM records."""
+
+from itertools import islice
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+from invenio_search.engine import search
+
+from .dumpers import StatisticsDumperExt
+
+
+class RDMRecordIndexer(RecordIndexer):
+    """Record indexer for RDM records.
+
+    Dumping a record for the search engine fetches its statistics and resolves
+    its related records (e.g. vocabularies), which would otherwise cost several
+    queries per record. While processing the bulk indexing queue, they are
+    fetched per chunk of messages instead.
+
+    If enabled, it also schedules the precomputation of the OAI-PMH formats of
+    the indexed (published) records.
+    """
+
+    #: Number of queued messages for which the statistics and relations are
+    #: fetched at once.
+    stats_prefetch_chunk_size = 500
+
+    def _get_recid_pairs(self, models):
+        """Get the ``(recid, parent_recid)`` pairs for the given record models."""
+        parent_model_cls = self.record_cls.parent_record_cls.model_cls
+
+        parent_ids = {model.parent_id for model in models}
+        parents = {
+            parent.id: parent.json
+            for parent in parent_model_cls.query.filter(
+                parent_model_cls.id.in_(parent_ids)
+            )
+        }
+
+        return [
+            (model.json["id"], parents[model.parent_id]["id"])
+            for model in models
+            if model.json and model.parent_id in parents
+        ]
+
+    def _prefetch(self, record_ids):
+        """Prefetch the statistics and relations of the records to be indexed."""
+        if not record_ids:
+            return
+
+        model_cls = self.record_cls.model_cls
+        models = model_cls.query.filter(model_cls.id.in_(record_ids)).all()
+
+        # the statistics are not dumped for drafts
+        if not self.record_cls.is_draft:
+            try:
+                StatisticsDumperExt.prefetch(self._get_recid_pairs(models))
+            except Exception:
+                # the dumper will fall back to fetching the statistics per record
+                current_app.logger.warning(
+                    "Failed to prefetch statistics", exc_info=True
+                )
+
+        try:
+            self.record_cls.relations.prefetch(
+                model.json for model in models if model.json
+            )
+        except Exception:
+            # the relations will fall back to resolving each related record
+            current_app.logger.warning("Failed to prefetch relations", exc_info=True)
+
+    def _clear_prefetched(self):
+        """Discard the prefetched statistics and relations."""
+        StatisticsDumperExt.clear_prefetched()
+        self.record_cls.relations.clear_prefetched()
+
+    def _update_oai_formats(self, record_ids):
+        """Schedule the precomputation of the OAI-PMH formats, if enabled."""
+        if (
+            not record_ids
+            or self.record_cls.is_draft
+            or not current_app.config.get("RDM_OAI_FORMATS_CACHE_ENABLED", False)
+        ):
+            return
+
+        from ..services.tasks import update_oai_formats
+
+        update_oai_formats.delay([str(record_id) for record_id in record_ids])
+
+    def index(self, record, arguments=None, **kwargs):
+        """Index a record."""
+        result = super().index(record, arguments=arguments, **kwargs)
+        self._update_oai_formats([record.id])
+        return result
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, prefetching the statistics per chunk."""
+        while True:
+            messages = list(islice(message_iterator, self.stats_prefetch_chunk_size))
+            if not messages:
+                break
+
+            record_ids = [
+                payload["id"]
+                for payload in (message.decode() for message in messages)
+                if payload["op"] != "delete"
+            ]
+            self._prefetch(record_ids)
+            self._update_oai_formats(record_ids)
+            try:
+                yield from super()._actionsiter(iter(messages))
+            finally:
+                self._clear_prefetched()
+
+    def index_ids(self, record_ids, search_bulk_kwargs=None):
+        """Index the given records synchronously, in a single bulk request.
+
+        Contrary to :meth:`bulk_index`, the records are not sent to the
+        indexing queue, which allows e.g. the CLI to parallelize the indexing.
+
+        :param record_ids: List of record UUIDs.
+        :param dict search_bulk_kwargs: Passed to `search.helpers.bulk`.
+        :returns: Tuple with the number of indexed records and errors.
+        """
+        record_ids = [str(record_id) for record_id in record_ids]
+        self._prefetch(record_ids)
+        self._update_oai_formats(record_ids)
+        try:
+            return search.helpers.bulk(
+                self.client,
+                (
+                    self._index_action({"id": record_id, "op": "index"})
+                    for record_id in record_ids
+                ),
+                stats_only=True,
+                request_timeout=current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"],
+                expand_action_callback=search.helpers.expand_action,
+                **(search_bulk_kwargs or {}),
+            )
+        finally:
+            self._clear_prefetched()
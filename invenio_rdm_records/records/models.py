@@ -230,3 +230,28 @@ class RDMUserQuota(db.Model, Timestamp):
 
     notes = db.Column(db.Text, nullable=False, default="")
     """Notes related to setting the quota."""
+
+
+class RDMRecordOAIFormat(db.Model, Timestamp):
+    """Store for the precomputed OAI-PMH serializations of a record."""
+
+    __tablename__ = "rdm_records_oai_formats"
+
+    record_id = db.Column(
+        UUIDType,
+        db.ForeignKey(RDMRecordMetadata.id, ondelete="CASCADE"),
+        primary_key=True,
+    )
+    """Record identifier."""
+
+    metadata_format = db.Column(db.String(255), primary_key=True)
+    """Name of the OAI-PMH format function which produced the serialization."""
+
+    revision_id = db.Column(db.Integer, nullable=False)
+    """Revision of the record at the time of the serialization."""
+
+    source_checksum = db.Column(db.String(64), nullable=False)
+    """Checksum of the indexed record the serialization was computed from."""
+
+    xml = db.Column(db.Text, nullable=False)
+    """The serialized metadata."""
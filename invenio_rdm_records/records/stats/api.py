@@ -12,6 +12,9 @@ factories deny access unless otherwise specified.
 """
 
 from flask import current_app
+from invenio_search.engine import dsl
+from invenio_search.proxies import current_search_client
+from invenio_search.utils import prefix_index
 from invenio_stats.proxies import current_stats
 
 
@@ -78,3 +81,105 @@ class Statistics:
         }
 
         return stats
+
+    @classmethod
+    def _get_bulk_query_results(cls, query_name, all_versions_query_name, pairs):
+        """Run one aggregation query for the given records and their parents.
+
+        The index and metrics are taken from the configured queries, so that the
+        results are consistent with the ones returned by the single record queries.
+        Returns a tuple of dictionaries mapping the ``recid`` (resp. ``parent_recid``)
+        to the computed metrics.
+        """
+        params = current_stats.queries[query_name].params
+        all_versions_params = current_stats.queries[all_versions_query_name].params
+        recids = list({recid for recid, _ in pairs})
+        parent_recids = list({parent_recid for _, parent_recid in pairs})
+
+        search = dsl.Search(
+            using=current_search_client,
+            index=prefix_index(params["index"]),
+        )[0:0]
+        search = search.filter(
+            dsl.Q("terms", recid=recids) | dsl.Q("terms", parent_recid=parent_recids)
+        )
+
+        aggs = (
+            ("this_version", "recid", recids, params["metric_fields"]),
+            (
+                "all_versions",
+                "parent_recid",
+                parent_recids,
+                all_versions_params["metric_fields"],
+            ),
+        )
+        for agg_name, field, ids, metric_fields in aggs:
+            bucket = search.aggs.bucket(agg_name, "filter", terms={field: ids}).bucket(
+                "ids", "terms", field=field, size=len(ids)
+            )
+            for dst, (metric, src_field, opts) in metric_fields.items():
+                bucket.metric(dst, metric, field=src_field, **opts)
+
+        aggregations = search.execute().aggregations.to_dict()
+        results = []
+        for agg_name, _, _, metric_fields in aggs:
+            results.append(
+                {
+                    bucket["key"]: {dst: bucket[dst]["value"] for dst in metric_fields}
+                    for bucket in aggregations[agg_name]["ids"]["buckets"]
+                }
+            )
+
+        return tuple(results)
+
+    @classmethod
+    def get_records_stats(cls, pairs):
+        """Fetch the statistics for many records at once.
+
+        Instead of running the four single record queries per record, the statistics
+        for all given records are computed with one aggregation query per statistics
+        index (i.e. views and downloads).
+
+        :param pairs: Iterable of ``(recid, parent_recid)`` tuples.
+        :returns: Dictionary mapping each ``recid`` to its statistics.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return {}
+
+        views_fallback = {"views": 0, "unique_views": 0}
+        downloads_fallback = {"downloads": 0, "unique_downloads": 0, "data_volume": 0}
+
+        try:
+            views, views_all = cls._get_bulk_query_results(
+                "record-view", "record-view-all-versions", pairs
+            )
+        except Exception as e:
+            # e.g. opensearchpy.exceptions.NotFoundError
+            # when the aggregation search index hasn't been created yet
+            current_app.logger.warning(e)
+            views, views_all = {}, {}
+
+        try:
+            downloads, downloads_all = cls._get_bulk_query_results(
+                "record-download", "record-download-all-versions", pairs
+            )
+        except Exception as e:
+            # same as above, but for failure in the download statistics
+            current_app.logger.warning(e)
+            downloads, downloads_all = {}, {}
+
+        stats = {}
+        for recid, parent_recid in pairs:
+            stats[recid] = {
+                "this_version": {
+                    **views.get(recid, views_fallback),
+                    **downloads.get(recid, downloads_fallback),
+                },
+                "all_versions": {
+                    **views_all.get(parent_recid, views_fallback),
+                    **downloads_all.get(parent_recid, downloads_fallback),
+                },
+            }
+
+        return stats
@@ -13,6 +13,7 @@ from .deletion_status import RecordDeletionStatusField
 from .draft_status import DraftStatus
 from .has_draftcheck import HasDraftCheckField
 from .is_verified import IsVerifiedField
+from .relations import RDMMultiRelationsField
 from .statistics import RecordStatisticsField
 from .tombstone import TombstoneField
 
@@ -21,6 +22,7 @@ __all__ = (
     "HasDraftCheckField",
     "IsVerifiedField",
     "ParentRecordAccessField",
+    "RDMMultiRelationsField",
     "RecordAccessField",
     "RecordStatisticsField",
     "RecordDeletionStatusField",
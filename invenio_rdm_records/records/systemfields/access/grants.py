@@ -278,8 +278,11 @@ class Grants(list):
 
     def extend(self, grants):
         """Add all new items from the specified grants to this list."""
+        existing = set(self)
         for grant in grants:
-            self.add(grant)
+            if grant not in existing:
+                existing.add(grant)
+                super().append(grant)
 
     def create(
         self,
@@ -8,7 +8,104 @@
 
 """Links class for the access system field."""
 
+import time
+from datetime import datetime
+
+from flask import current_app, g, has_app_context
+from invenio_db import db
+from sqlalchemy import event
+
 from ....secret_links.models import SecretLink
+from ....secret_links.permissions import LinkNeed
+from ....secret_links.signals import link_revoked
+
+# links permission data shared across requests, i.e. {link_id: (timestamp, data)}
+_shared_links_cache = {}
+_shared_links_cache_max_size = 10000
+
+
+def _get_links_cache():
+    """Get the links permission data cache of the current request."""
+    if "rdm_records_secret_links" not in g:
+        g.rdm_records_secret_links = {}
+    return g.rdm_records_secret_links
+
+
+def _link_data(link):
+    """Get the permission data of a secret link, as cached."""
+    if link is None:
+        return None
+    return {"permission_level": link.permission_level, "expires_at": link.expires_at}
+
+
+def _cache_links_data(links_data):
+    """Store the permission data of secret links in the caches."""
+    _get_links_cache().update(links_data)
+    ttl = current_app.config.get("RDM_SECRET_LINKS_CACHE_TTL")
+    if ttl:
+        now = time.monotonic()
+        if len(_shared_links_cache) > _shared_links_cache_max_size:
+            for link_id, (timestamp, _) in list(_shared_links_cache.items()):
+                if now - timestamp >= ttl:
+                    _shared_links_cache.pop(link_id, None)
+        _shared_links_cache.update(
+            (link_id, (now, data)) for link_id, data in links_data.items()
+        )
+
+
+def get_links_data(link_ids):
+    """Get the permission data of many secret links at once.
+
+    The data is cached for the current request and, if
+    ``RDM_SECRET_LINKS_CACHE_TTL`` is set, shared across requests for at most
+    that many seconds. Links missing from the caches are fetched with a single
+    query.
+
+    :returns: dict mapping each link ID to a dict with its ``permission_level``
+        and ``expires_at``, or to ``None`` if the link does not exist.
+    """
+    cache = _get_links_cache()
+    missing = {str(link_id) for link_id in link_ids} - cache.keys()
+
+    ttl = current_app.config.get("RDM_SECRET_LINKS_CACHE_TTL")
+    if missing and ttl:
+        now = time.monotonic()
+        for link_id in list(missing):
+            timestamp, data = _shared_links_cache.get(link_id, (0, None))
+            if now - timestamp < ttl:
+                cache[link_id] = data
+                missing.discard(link_id)
+
+    if missing:
+        links_data = dict.fromkeys(missing)
+        rows = db.session.query(
+            SecretLink.id, SecretLink.permission_level, SecretLink.expires_at
+        ).filter(SecretLink.id.in_(missing))
+        for row in rows:
+            links_data[str(row.id)] = _link_data(row)
+        _cache_links_data(links_data)
+
+    return {str(link_id): cache[str(link_id)] for link_id in link_ids}
+
+
+def clear_link_cache(link_id):
+    """Remove the permission data of a secret link from the caches."""
+    _shared_links_cache.pop(str(link_id), None)
+    if has_app_context():
+        g.get("rdm_records_secret_links", {}).pop(str(link_id), None)
+
+
+@link_revoked.connect
+def _on_link_revoked(link):
+    """Invalidate the cached permission data of a revoked link."""
+    clear_link_cache(link.id)
+
+
+@event.listens_for(SecretLink, "after_update")
+@event.listens_for(SecretLink, "after_delete")
+def _on_link_changed(mapper, connection, link):
+    """Invalidate the cached permission data of an updated or deleted link."""
+    clear_link_cache(link.id)
 
 
 class Link:
@@ -123,20 +220,35 @@ class Links(list):
     def resolve_all(self):
         """Resolve all available links in this list and return them.
 
-        Note: This will perform database queries!
+        Note: This will perform a database query for the unresolved links!
         """
-        resolved_links = (link.resolve() for link in self)
-        return [link for link in resolved_links if link is not None]
+        unresolved = {link.link_id: link for link in self if link._entity is None}
+        if unresolved:
+            entities = SecretLink.query.filter(SecretLink.id.in_(unresolved))
+            for entity in entities:
+                unresolved[str(entity.id)]._entity = entity
+            _cache_links_data(
+                {
+                    link_id: _link_data(link._entity)
+                    for link_id, link in unresolved.items()
+                }
+            )
+
+        return [link._entity for link in self if link._entity is not None]
 
     def needs(self, permission):
         """Get allowed needs for the given permission level.
 
-        Note: This will perform database queries!
+        Note: This will perform a database query for the uncached links!
         """
+        now = datetime.utcnow()
+        links_data = get_links_data([link.link_id for link in self])
         return [
-            link.need
-            for link in self.resolve_all()
-            if not link.is_expired and link.permission_level == permission
+            LinkNeed(link_id)
+            for link_id, data in links_data.items()
+            if data is not None
+            and data["permission_level"] == permission
+            and not (data["expires_at"] and now > data["expires_at"])
         ]
 
     def dump(self):
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Relations system field with bulk dereferencing."""
+
+from flask import g, has_app_context
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.systemfields.relations import MultiRelationsField
+from invenio_records.systemfields.relations.results import RelationListResult
+from invenio_records_resources.records.systemfields import PIDRelation
+from invenio_records_resources.records.systemfields.pid import ModelPIDFieldContext
+
+
+def _resolver_key(pid_field):
+    """Get a key identifying the related records resolved by a PID field."""
+    if isinstance(pid_field, ModelPIDFieldContext):
+        return (pid_field.record_cls, pid_field.field.model_field_name)
+    pid_type = getattr(pid_field, "pid_type", None) or pid_field.field._pid_type
+    return (pid_field.record_cls, pid_type)
+
+
+def _lookup_ids(field, data):
+    """Get the PID values referenced by a relation in a record's data."""
+    result = field.result_cls(field, data)
+    if not isinstance(result, RelationListResult):
+        try:
+            return [result._lookup_id()]
+        except KeyError:
+            return []
+
+    ids = []
+    result._apply_items(
+        lambda v, keys, attrs: ids.append(v[field._value_key_suffix]),
+    )
+    return ids
+
+
+def _resolve_many(pid_field, ids):
+    """Resolve many related records at once, keyed by PID value."""
+    record_cls = pid_field.record_cls
+
+    if isinstance(pid_field, ModelPIDFieldContext):
+        # PID stored in a column of the related record table
+        column = getattr(record_cls.model_cls, pid_field.field.model_field_name)
+        with db.session.no_autoflush:
+            models = record_cls.model_cls.query.filter(column.in_(ids)).all()
+        records = [record_cls(model.data, model=model) for model in models]
+        return {record.pid.pid_value: record for record in records}
+
+    pids = PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_type == _resolver_key(pid_field)[1],
+        PersistentIdentifier.pid_value.in_(ids),
+        PersistentIdentifier.status == PIDStatus.REGISTERED,
+    ).all()
+    records = {
+        record.id: record
+        for record in record_cls.get_records([pid.object_uuid for pid in pids])
+    }
+
+    resolved = {}
+    for pid in pids:
+        record = records.get(pid.object_uuid)
+        if record is not None:
+            pid_field.field._set_cache(record, pid)
+            resolved[pid.pid_value] = record
+    return resolved
+
+
+class RDMMultiRelationsField(MultiRelationsField):
+    """Relations field which can dereference the relations of many records.
+
+    Each record resolves its related records one by one when dumped, which is
+    costly when (re)indexing many records. The related records referenced by a
+    batch of records can instead be resolved upfront via ``prefetch()``, with
+    one query per related record type, and are then shared by the relations of
+    all the records accessed in the same context.
+    """
+
+    #: Key on the application context globals for the prefetched relations.
+    prefetch_key = "rdm_records_prefetched_relations"
+
+    def obj(self, instance):
+        """Get the relations object, filled with the prefetched relations."""
+        obj = self._get_cache(instance)
+        if obj:
+            return obj
+
+        obj = super().obj(instance)
+        prefetched = g.get(self.prefetch_key) if has_app_context() else None
+        if prefetched:
+            for cache_key, resolved in prefetched.items():
+                obj._cache.setdefault(cache_key, {}).update(resolved)
+        return obj
+
+    def prefetch(self, records_data):
+        """Resolve the related records referenced by many records.
+
+        Relations sharing a cache key but resolving different types of related
+        records are not prefetched, since their PID values may collide.
+
+        :param records_data: Iterable of the records' data (i.e. dictionaries).
+        """
+        records_data = list(records_data)
+        # the cache key of a relation defaults to its name (see `inject_cache`)
+        relations = [
+            (field._cache_key or name, field)
+            for name, field in self._fields.items()
+            if isinstance(field, PIDRelation)
+        ]
+
+        # find the cache keys which are safe to prefill
+        cache_resolvers = {}
+        for cache_key, field in relations:
+            cache_resolvers.setdefault(cache_key, set()).add(
+                _resolver_key(field.pid_field)
+            )
+
+        # collect the referenced PID values, per type of related records
+        to_resolve = {}
+        for cache_key, field in relations:
+            if len(cache_resolvers[cache_key]) > 1:
+                continue
+            pid_field, ids, cache_keys = to_resolve.setdefault(
+                _resolver_key(field.pid_field), (field.pid_field, set(), set())
+            )
+            cache_keys.add(cache_key)
+            for data in records_data:
+                ids.update(_lookup_ids(field, data))
+
+        prefetched = g.setdefault(self.prefetch_key, {})
+        for pid_field, ids, cache_keys in to_resolve.values():
+            if not ids:
+                continue
+            resolved = _resolve_many(pid_field, list(ids))
+            for record in resolved.values():
+                # detach the related records from the session, like the
+                # relations do when caching them
+                db.session.expunge(record.model)
+            for cache_key in cache_keys:
+                prefetched.setdefault(cache_key, {}).update(resolved)
+
+    def clear_prefetched(self):
+        """Discard the prefetched relations."""
+        g.pop(self.prefetch_key, None)
@@ -14,8 +14,8 @@ from invenio_vocabularies.proxies import current_service
 
 from ...proxies import current_rdm_records_service
 from .tasks import (
-    delete_record,
-    restore_record,
+    delete_records,
+    restore_records,
     user_block_cleanup,
     user_restore_cleanup,
 )
@@ -43,8 +43,11 @@ def on_block(user_id, uow=None, **kwargs):
         pass
 
     # soft-delete all the published records of that user
-    for recid in get_user_records(user_id):
-        uow.register(TaskOp(delete_record, recid=recid, tombstone_data=tombstone_data))
+    recids = list(get_user_records(user_id))
+    if recids:
+        uow.register(
+            TaskOp(delete_records, recids=recids, tombstone_data=tombstone_data)
+        )
 
     # Send cleanup task to make sure all records are deleted
     uow.register(
@@ -67,8 +70,9 @@ def on_restore(user_id, uow=None, **kwargs):
     user_id = str(user_id)
 
     # restore all the deleted records of that user
-    for recid in get_user_records(user_id):
-        uow.register(TaskOp(restore_record, recid=recid))
+    recids = list(get_user_records(user_id))
+    if recids:
+        uow.register(TaskOp(restore_records, recids=recids))
 
     # Send cleanup task to make sure all records are restored
     uow.register(
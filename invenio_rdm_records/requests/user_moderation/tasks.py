@@ -28,13 +28,15 @@ def user_block_cleanup(user_id, tombstone_data):
     if not user.blocked:
         return
 
-    for recid in get_user_records(
+    recids = get_user_records(
         user_id,
         from_db=True,
         # Only fetch published records that might have not been deleted yet.
         status=[RecordDeletionStatusEnum.PUBLISHED],
-    ):
-        delete_record.delay(recid, tombstone_data)
+    )
+    current_rdm_records_service.bulk_delete_records(
+        system_identity, recids, tombstone_data
+    )
 
 
 @shared_task(ignore_result=True)
@@ -45,13 +47,27 @@ def user_restore_cleanup(user_id):
     if user.blocked:
         return
 
-    for recid in get_user_records(
+    recids = get_user_records(
         user_id,
         from_db=True,
         # Only fetch deleted records that might have not been restored yet.
         status=[RecordDeletionStatusEnum.DELETED],
-    ):
-        restore_record.delay(recid)
+    )
+    current_rdm_records_service.bulk_restore_records(system_identity, recids)
+
+
+@shared_task(ignore_result=True)
+def delete_records(recids, tombstone_data):
+    """Delete records in bulk."""
+    current_rdm_records_service.bulk_delete_records(
+        system_identity, recids, tombstone_data
+    )
+
+
+@shared_task(ignore_result=True)
+def restore_records(recids):
+    """Restore records in bulk."""
+    current_rdm_records_service.bulk_restore_records(system_identity, recids)
 
 
 @shared_task(ignore_result=True)
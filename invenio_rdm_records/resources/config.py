@@ -259,6 +259,7 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
     routes["item-revision-list"] = "/<pid_value>/revisions"
     routes["item-revision"] = "/<pid_value>/revisions/<revision_id>"
     routes["request-deletion"] = "/<pid_value>/request-deletion"
+    routes["export-csv"] = "/export/csv"
 
     request_view_args = {
         "pid_value": ma.fields.Str(),
@@ -271,6 +272,9 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         "locale": ma.fields.Str(),
         "include_deleted": ma.fields.Bool(),
         "include_previous": ma.fields.Bool(),
+        "page": ma.fields.Int(validate=ma.validate.Range(min=1)),
+        "size": ma.fields.Int(validate=ma.validate.Range(min=1)),
+        "include_json": ma.fields.Bool(),
     }
 
     request_body_parsers = {
@@ -265,7 +265,7 @@ class IIIFResource(ErrorHandlersMixin, Resource):
         size = resource_requestctx.view_args["size"]
         rotation = resource_requestctx.view_args["rotation"]
         quality = resource_requestctx.view_args["quality"]
-        to_serve = self.service.image_api(
+        image_params = dict(
             identity=g.identity,
             uuid=uuid,
             region=region,
@@ -274,12 +274,25 @@ class IIIFResource(ErrorHandlersMixin, Resource):
             quality=quality,
             image_format=image_format,
         )
+
+        # answer conditional requests before touching the image
+        etag, last_modified = self.service.image_api_validators(**image_params)
+        not_modified = False
+        if request.if_none_match:
+            not_modified = bool(etag) and request.if_none_match.contains_weak(etag)
+        elif request.if_modified_since and last_modified:
+            not_modified = request.if_modified_since >= last_modified
+        if not_modified:
+            response = Response(status=304)
+            if etag:
+                response.set_etag(etag)
+            response.last_modified = last_modified
+            return response
+
+        to_serve = self.service.image_api(**image_params)
         # decide the mime_type from the requested image_format
         mimetype = self.config.supported_formats.get(image_format, "image/jpeg")
-        # TODO: get from cache on the service image.last_modified
-        last_modified = None
-        send_file_kwargs = {"mimetype": mimetype}
-        # last_modified is not supported before flask 0.12
+        send_file_kwargs = {"mimetype": mimetype, "etag": etag or False}
         if last_modified:
             send_file_kwargs.update(last_modified=last_modified)
 
@@ -303,10 +316,6 @@ class IIIFResource(ErrorHandlersMixin, Resource):
                 send_file_kwargs.update(
                     download_name=secure_filename(filename),
                 )
-        if_modified_since = resource_requestctx.headers.get("If-Modified-Since")
-        if if_modified_since and last_modified and if_modified_since >= last_modified:
-            raise HTTPJSONException(code=304)
-
         response = send_file(to_serve, **send_file_kwargs)
         return response
 
@@ -12,9 +12,21 @@
 
 """Bibliographic Record Resource."""
 
+import hashlib
+from datetime import timezone
 from functools import wraps
 
-from flask import abort, current_app, flash, g, redirect, url_for
+from flask import (
+    Response,
+    abort,
+    current_app,
+    flash,
+    g,
+    redirect,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_resources import Resource, resource_requestctx, response_handler, route
 from invenio_base import invenio_url_for
 from invenio_drafts_resources.resources import RecordResource
@@ -32,6 +44,11 @@ from invenio_records_resources.resources.records.utils import search_preference
 from invenio_stats import current_stats
 from sqlalchemy.exc import NoResultFound
 
+from .serializers import CSVRecordSerializer
+
+RECORD_VARY_HEADERS = ("Cookie", "Authorization")
+"""Request headers identifying the user, on which a record representation depends."""
+
 
 def response_header_signposting(f):
     """Add signposting link to view's reponse headers.
@@ -60,6 +77,36 @@ def response_header_signposting(f):
     return inner
 
 
+def _record_validators(record, identity):
+    """Get the ``ETag`` and ``Last-Modified`` values of a record representation.
+
+    The ETag changes with the revision of the record and its parent, with the
+    negotiated format and the query string of the request, as well as with the
+    needs provided by the identity, since they decide which fields and links
+    the representation contains.
+    """
+    parent = record.parent
+    needs = sorted(str(need) for need in identity.provides)
+    validator = ":".join(
+        [
+            str(record.id),
+            str(record.revision_id),
+            str(parent.revision_id),
+            resource_requestctx.accept_mimetype or "",
+            request.query_string.decode("utf-8"),
+            *needs,
+        ]
+    )
+    etag = hashlib.md5(validator.encode("utf-8")).hexdigest()
+
+    last_modified = max(record.updated, parent.updated)
+    if not last_modified.tzinfo:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    last_modified = last_modified.replace(microsecond=0)
+
+    return etag, last_modified
+
+
 class RDMRecordResource(RecordResource):
     """RDM record resource."""
 
@@ -97,20 +144,63 @@ class RDMRecordResource(RecordResource):
             route("GET", p(routes["item-revision-list"]), self.search_revisions),
             route("GET", p(routes["item-revision"]), self.read_revision),
             route("POST", p(routes["request-deletion"]), self.request_deletion),
+            route("GET", p(routes["export-csv"]), self.export_csv),
         ]
 
         return url_rules
 
     @request_headers
     @request_extra_args
+    @request_read_args
     @request_view_args
     def search_revisions(self):
-        """Return all revisions of a record."""
+        """Return the revisions of a record.
+
+        :param: page: The page of revisions to return, if ``size`` is given.
+        :param: size: The number of revisions per page (all if not given).
+        :param: include_json: If False, return only the revisions metadata.
+
+        The total number of revisions is returned in the ``X-Total-Count``
+        header, for paginating them.
+        """
         item = self.service.search_revisions(
-            identity=g.identity, id_=resource_requestctx.view_args["pid_value"]
+            identity=g.identity,
+            id_=resource_requestctx.view_args["pid_value"],
+            page=resource_requestctx.args.get("page"),
+            size=resource_requestctx.args.get("size"),
+            include_json=resource_requestctx.args.get("include_json", True),
         )
 
-        return item.to_dict(), 200
+        return item.to_dict(), 200, {"X-Total-Count": str(item.total)}
+
+    @request_extra_args
+    @request_search_args
+    def export_csv(self):
+        """Export all the records matching the search as a CSV stream.
+
+        The records are fetched with a scan over the search results, and the
+        rows are written as they are fetched, with the fixed columns of
+        ``RDM_RECORDS_CSV_EXPORT_FIELDS``.
+        """
+        # the whole result set is scanned, pagination and sorting don't apply
+        params = {
+            key: value
+            for key, value in resource_requestctx.args.items()
+            if key not in ("page", "size", "sort")
+        }
+        result = self.service.scan(identity=g.identity, params=params)
+
+        fields = current_app.config["RDM_RECORDS_CSV_EXPORT_FIELDS"]
+        serializer = CSVRecordSerializer(
+            csv_included_fields=fields, collapse_lists=True
+        )
+        return Response(
+            stream_with_context(
+                serializer.serialize_object_stream(result.source_hits(fields))
+            ),
+            mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=records.csv"},
+        )
 
     @request_headers
     @request_extra_args
@@ -162,6 +252,21 @@ class RDMRecordResource(RecordResource):
                 None,  # We pass None to create a tuple as the response_handler always expects an iterable
             )
 
+        # answer conditional requests before projecting and serializing the record
+        etag, last_modified = _record_validators(item._record, g.identity)
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains_weak(etag)
+        elif request.if_modified_since:
+            not_modified = request.if_modified_since >= last_modified
+        else:
+            not_modified = False
+        if not_modified:
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.vary.update(RECORD_VARY_HEADERS)
+            return response, None
+
         # we emit the record view stats event here rather than in the service because
         # the service might be called from other places as well that we don't want
         # to count, e.g. from some CLI commands
@@ -169,7 +274,13 @@ class RDMRecordResource(RecordResource):
         if item is not None and emitter is not None:
             emitter(current_app, record=item._record, via_api=True)
 
-        return item.to_dict(), 200
+        response = resource_requestctx.response_handler.make_response(
+            item.to_dict(), 200
+        )
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        response.vary.update(RECORD_VARY_HEADERS)
+        return response, None
 
     @request_headers
     @request_view_args
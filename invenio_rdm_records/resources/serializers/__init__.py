@@ -11,7 +11,8 @@
 
 ATTENTION: Serializers MUST NOT query for data (e.g. use a service)!
 
-The only allowed data querying is "get_vocabulary_props()" which is cached.
+The only allowed data querying is "get_vocabulary_props()" which is cached
+in-process per vocabulary type.
 Querying for data in a serializer will most likely result in very bad
 performance for the OAI-PMH server and search results serialzations.
 """
@@ -7,7 +7,10 @@
 
 """CSV Serializer for Invenio RDM Records."""
 
+import csv
+
 from flask_resources.serializers import CSVSerializer
+from flask_resources.serializers.csv import Line
 
 
 class CSVRecordSerializer(CSVSerializer):
@@ -16,3 +19,23 @@ class CSVRecordSerializer(CSVSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(header_separator=".", **options)
+
+    def serialize_object_stream(self, obj_iter):
+        """Serialize the records one by one, yielding the lines of the CSV.
+
+        The header is built from the included fields, so that the lines can be
+        written while the records are being fetched.
+        """
+        if not self.csv_included_fields:
+            raise ValueError("Streaming requires a fixed list of included fields.")
+
+        line = Line()
+        writer = csv.DictWriter(
+            line, fieldnames=self.csv_included_fields, extrasaction="ignore"
+        )
+        writer.writeheader()
+        yield line.read()
+
+        for obj in obj_iter:
+            writer.writerow(self.process_dict(obj))
+            yield line.read()
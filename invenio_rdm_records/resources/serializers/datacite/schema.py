@@ -14,7 +14,6 @@ from babel_edtf import parse_edtf
 from edtf.parser.grammar import ParseException
 from flask import current_app
 from flask_resources.serializers import BaseSerializerSchema
-from invenio_access.permissions import system_identity
 from invenio_base import invenio_url_for
 from invenio_i18n import lazy_gettext as _
 from marshmallow import Schema, ValidationError, fields, missing, post_dump, validate
@@ -22,7 +21,7 @@ from marshmallow_utils.fields import SanitizedUnicode
 from marshmallow_utils.html import strip_html
 from pydash import py_
 
-from ....proxies import current_rdm_records_service
+from ....proxies import current_rdm_records, current_rdm_records_service
 from ...serializers.ui.schema import current_default_locale
 from ..utils import get_preferred_identifier, get_vocabulary_props
 
@@ -50,10 +49,19 @@ RELATED_IDENTIFIER_SCHEMES = {
 """Allowed related identifier schemes for DataCite. Vocabulary taken from DataCite 4.3 schema definition."""
 
 
+def _datacite_schemes(config_item):
+    """Map the schemes of a schemes configuration to their datacite equivalent."""
+    return {
+        scheme: scheme_config["datacite"]
+        for scheme, scheme_config in config_item.items()
+        if "datacite" in scheme_config
+    }
+
+
 def get_scheme_datacite(scheme, config_name, default=None):
     """Returns the datacite equivalent of a scheme."""
-    config_item = current_app.config[config_name]
-    return config_item.get(scheme, {}).get("datacite", default)
+    schemes = current_rdm_records.serializers.lookup(config_name, _datacite_schemes)
+    return schemes.get(scheme, default)
 
 
 class PersonOrOrgSchema43(Schema):
@@ -409,30 +417,23 @@ class DataCite43Schema(BaseSerializerSchema):
 
         # Generate parent/child versioning relationships
         if self.context.get("is_parent"):
-            # Fetch DOIs for all versions
-            # NOTE: The refresh is safe to do here since we'll be in Celery task
-            current_rdm_records_service.indexer.refresh()
-            record_versions = current_rdm_records_service.scan_versions(
-                system_identity,
-                obj._child["id"],
-                params={"_source_includes": "pids.doi"},
+            # Fetch DOIs for all versions, from the database to not depend on
+            # the records index being refreshed
+            record_cls = current_rdm_records_service.record_cls
+            versions_dois = record_cls.get_published_pids_by_parent(obj._parent, "doi")
+            id_scheme = get_scheme_datacite(
+                "doi",
+                "RDM_RECORDS_IDENTIFIERS_SCHEMES",
+                default="DOI",
             )
-            for version in record_versions:
-                version_doi = version.get("pids", {}).get("doi")
-                id_scheme = get_scheme_datacite(
-                    "doi",
-                    "RDM_RECORDS_IDENTIFIERS_SCHEMES",
-                    default="DOI",
+            for version_doi in versions_dois:
+                serialized_identifiers.append(
+                    {
+                        "relatedIdentifier": version_doi["identifier"],
+                        "relationType": "HasVersion",
+                        "relatedIdentifierType": id_scheme,
+                    }
                 )
-
-                if version_doi:
-                    serialized_identifiers.append(
-                        {
-                            "relatedIdentifier": version_doi["identifier"],
-                            "relationType": "HasVersion",
-                            "relatedIdentifierType": id_scheme,
-                        }
-                    )
         else:
             if hasattr(obj, "parent"):
                 parent_record = obj.parent
@@ -36,6 +36,10 @@ class DCATSerializer(MarshmallowSerializer):
             **options,
         )
 
+    def dump_etree(self, obj):
+        """Dump the object into an lxml element tree."""
+        return self.transform_with_xslt(self.dump_obj(obj))
+
     def _etree_tostring(self, record, **kwargs):
         root = self.transform_with_xslt(record, **kwargs)
         return ET.tostring(
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Registry of the serializers of an application."""
+
+from flask import current_app
+
+
+class SerializersRegistry:
+    """Serializers and config-derived lookups, built once per application.
+
+    Building a serializer instantiates its marshmallow schemas, which is
+    wasteful when done for each serialized record (e.g. in OAI-PMH). The
+    registry builds a serializer the first time it is requested and reuses
+    it afterwards, as the response handlers of the resources already do.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._serializers = {}
+        self._lookups = {}
+
+    def get(self, serializer_cls):
+        """Get the serializer instance of a class (with its default options)."""
+        serializer = self._serializers.get(serializer_cls)
+        if serializer is None:
+            serializer = self._serializers[serializer_cls] = serializer_cls()
+        return serializer
+
+    def lookup(self, config_name, build):
+        """Get a lookup derived from a configuration value.
+
+        The lookup is rebuilt whenever the configuration value is replaced.
+
+        :param config_name: Name of the configuration variable.
+        :param build: Callable building the lookup from the configuration value.
+        """
+        value = current_app.config[config_name]
+        key = (config_name, build)
+        cached = self._lookups.get(key)
+        if cached is None or cached[0] is not value:
+            cached = self._lookups[key] = (value, build(value))
+        return cached[1]
@@ -10,19 +10,74 @@
 """Helpers for serializers."""
 
 import math
+import time
 
+from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_i18n import lazy_gettext as _
 from invenio_search.engine import dsl
 from invenio_vocabularies.proxies import current_service as vocabulary_service
+from invenio_vocabularies.records.models import VocabularyMetadata
+from sqlalchemy import event
 
 from .errors import VocabularyItemNotFoundError
 
+_vocabulary_props_cache = {}
+"""In-process cache of the vocabulary props, per vocabulary type and fields."""
+
+
+def clear_vocabulary_props_cache(*args, **kwargs):
+    """Clear the in-process cache of the vocabulary props.
+
+    The cache is cleared whenever a vocabulary item is created, updated or
+    deleted in this process. Other processes pick up the changes once their
+    cached entries expire (see ``RDM_VOCABULARY_PROPS_CACHE_TTL``).
+    """
+    _vocabulary_props_cache.clear()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(VocabularyMetadata, _event_name, clear_vocabulary_props_cache)
+
+
+def _get_vocabulary_props_map(vocabulary, fields):
+    """Get the props of all the items of a vocabulary, keyed by item id.
+
+    Returns ``None`` if the cache is disabled.
+    """
+    ttl = current_app.config["RDM_VOCABULARY_PROPS_CACHE_TTL"]
+    if not ttl:
+        return None
+
+    key = (vocabulary, tuple(fields))
+    now = time.monotonic()
+
+    cached = _vocabulary_props_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    results = vocabulary_service.read_all(
+        system_identity,
+        ["id"] + fields,
+        vocabulary,
+        cache=False,
+        max_records=current_app.config["RDM_VOCABULARY_PROPS_CACHE_MAX_ITEMS"],
+    )
+    props = {h["id"]: h.get("props", {}) for h in results.hits}
+    _vocabulary_props_cache[key] = (now, props)
+    return props
+
 
 def get_vocabulary_props(vocabulary, fields, id_):
     """Returns props associated with a vocabulary, id_."""
-    # This is ok given that read_all is cached per vocabulary+fields and
-    # is reused overtime
+    # The whole vocabulary is loaded at once and cached in-process, so that
+    # serializing many records costs a single query per vocabulary
+    props_map = _get_vocabulary_props_map(vocabulary, fields)
+    if props_map is not None and id_ in props_map:
+        return props_map[id_]
+
+    # The item might have been created after the vocabulary was loaded, or
+    # the vocabulary might be larger than what is loaded at once
     results = vocabulary_service.read_all(
         system_identity,
         ["id"] + fields,
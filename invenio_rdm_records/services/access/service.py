@@ -16,6 +16,8 @@ import arrow
 from flask import current_app
 from flask_login import current_user
 from invenio_access.permissions import authenticated_user, system_identity
+from invenio_access.proxies import current_access
+from invenio_accounts.models import Role, User
 from invenio_base import invenio_url_for
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
@@ -27,6 +29,7 @@ from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 from invenio_requests.proxies import current_requests_service
 from invenio_search.engine import dsl
 from invenio_users_resources.proxies import current_user_resources
+from invenio_users_resources.records import GroupAggregate, UserAggregate
 from marshmallow.exceptions import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -35,6 +38,9 @@ from invenio_rdm_records.notifications.builders import (
     GuestAccessRequestTokenCreateNotificationBuilder,
 )
 
+from ...notifications.uow import NotificationBulkOp
+from ...records.systemfields.access.grants import Grant
+from ...records.systemfields.access.links import clear_link_cache
 from ...requests.access import AccessRequestToken, GuestAccessRequest, UserAccessRequest
 from ...secret_links.errors import InvalidPermissionLevelError
 from ..decorators import groups_enabled
@@ -311,6 +317,7 @@ class RecordAccessService(RecordService):
         link.expires_at = expires_at or link.expires_at
         link.permission_level = permission or link.permission_level
         link.description = data.get("description", link.description)
+        clear_link_cache(link.id)
 
         uow.register(ParentRecordCommitOp(parent, indexer_context=dict(service=self)))
         self._update_parent_request(parent, uow)
@@ -376,6 +383,43 @@ class RecordAccessService(RecordService):
             #       "not found" errors, to not leak information about existence
             return False
 
+    def _get_visible_grant_subjects(self, identity, grants):
+        """Get the keys of the grant subjects visible to the given identity.
+
+        The users and groups are fetched with one query per subject type, instead
+        of reading them one by one through their services.
+        """
+        subject_ids = {}
+        for grant in grants:
+            subject_ids.setdefault(grant.subject_type, set()).add(grant.subject_id)
+
+        visible = set()
+        user_ids = [int(id_) for id_ in subject_ids.get("user", []) if id_.isdigit()]
+        if user_ids:
+            users_service = current_user_resources.users_service
+            for user in User.query.filter(User.id.in_(user_ids)):
+                if users_service.check_permission(
+                    identity, "read", record=UserAggregate.from_model(user)
+                ):
+                    visible.add(("user", str(user.id)))
+
+        role_ids = subject_ids.get(RecordAccessService.group_subject_type)
+        if role_ids:
+            groups_service = current_user_resources.groups_service
+            for role in Role.query.filter(Role.id.in_(role_ids)):
+                if groups_service.check_permission(
+                    identity, "read", record=GroupAggregate.from_model(role)
+                ):
+                    visible.add((RecordAccessService.group_subject_type, role.id))
+
+        # NOTE: system roles don't have a service yet, so we check them against
+        #       the registered system roles (c.f. `Grant.resolve_subject`)
+        for system_role in subject_ids.get("system_role", []):
+            if system_role in current_access.system_roles:
+                visible.add(("system_role", system_role))
+
+        return visible
+
     @unit_of_work()
     def bulk_create_grants(self, identity, id_, data, expand=False, uow=None):
         """Bulk create access grants for a record (resp. its parent)."""
@@ -391,50 +435,58 @@ class RecordAccessService(RecordService):
 
         grants = data["grants"]
 
-        new_grants = []
-
         # fail if any of the grants already exist
-        if any(
-            existing_grant.subject_id == grant["subject"]["id"]
-            and existing_grant.subject_type == grant["subject"]["type"]
+        existing_subjects = {
+            (existing_grant.subject_type, existing_grant.subject_id)
             for existing_grant in parent.access.grants
+        }
+        if any(
+            (grant["subject"]["type"], grant["subject"]["id"]) in existing_subjects
             for grant in grants
         ):
             raise GrantExistsError()
 
-        for grant in grants:
-            # checks if groups are enabled in the instance
-            if (
-                not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False)
-                and grant["subject"]["type"] == RecordAccessService.group_subject_type
-            ):
-                raise PermissionDeniedError()
+        # checks if groups are enabled in the instance
+        if not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False) and any(
+            grant["subject"]["type"] == RecordAccessService.group_subject_type
+            for grant in grants
+        ):
+            raise PermissionDeniedError()
 
-            # Creation
-            new_grant = parent.access.grants.create(
+        # Creation
+        new_grants = [
+            Grant.create(
                 subject_type=grant["subject"]["type"],
                 subject_id=grant["subject"]["id"],
                 permission=grant["permission"],
                 origin=grant.get("origin"),
             )
+            for grant in grants
+        ]
 
-            if not self._validate_grant_subject(identity, new_grant):
-                raise ValidationError(
-                    _("Could not find the specified subject."), field_name="subject.id"
-                )
+        visible_subjects = self._get_visible_grant_subjects(identity, new_grants)
+        if any(
+            (new_grant.subject_type, new_grant.subject_id) not in visible_subjects
+            for new_grant in new_grants
+        ):
+            raise ValidationError(
+                _("Could not find the specified subject."), field_name="subject.id"
+            )
 
-            if grant["subject"]["type"] == "user" and grant.get("notify"):
-                uow.register(
-                    NotificationOp(
-                        GrantUserAccessNotificationBuilder.build(
-                            record=record,
-                            user={"user": grant["subject"]["id"]},
-                            permission=grant["permission"],
-                            message=grant.get("message"),
-                        )
-                    )
-                )
-            new_grants.append(new_grant)
+        parent.access.grants.extend(new_grants)
+
+        notifications = [
+            GrantUserAccessNotificationBuilder.build(
+                record=record,
+                user={"user": grant["subject"]["id"]},
+                permission=grant["permission"],
+                message=grant.get("message"),
+            )
+            for grant in grants
+            if grant["subject"]["type"] == "user" and grant.get("notify")
+        ]
+        if notifications:
+            uow.register(NotificationBulkOp(notifications))
 
         uow.register(ParentRecordCommitOp(parent, indexer_context=dict(service=self)))
         self._update_parent_request(parent, uow)
@@ -16,6 +16,7 @@ from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
 from invenio_notifications.services.uow import NotificationOp
 from invenio_pidstore.errors import PIDDoesNotExistError, PIDUnregistered
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records_resources.services import (
     RecordIndexerMixin,
     Service,
@@ -29,6 +30,7 @@ from invenio_records_resources.services.uow import (
 )
 from invenio_requests import current_request_type_registry, current_requests_service
 from invenio_requests.resolvers.registry import ResolverRegistry
+from invenio_search.api import RecordsSearchV2
 from invenio_search.engine import dsl
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -43,6 +45,7 @@ from ..errors import (
     RecordCommunityMissing,
     RecordSubmissionClosedCommunityError,
 )
+from ..uow import ParentRecordsBulkCommitOp
 
 
 class RecordCommunitiesService(Service, RecordIndexerMixin):
@@ -303,36 +306,36 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
         )
 
     @staticmethod
-    def _get_excluded_communities_filter(record, identity, id_):
-        """Return filter to exclude communities that should not be suggested."""
-        communities_to_exclude = []
-        communities_ids = record.parent.communities.ids
-
-        for community_id in communities_ids:
-            communities_to_exclude.append(dsl.Q("term", **{"id": community_id}))
+    def _get_excluded_communities_filter(record, id_):
+        """Return filter to exclude communities that should not be suggested.
+
+        The communities of the record and the ones with an open inclusion request
+        for the record are excluded. The open requests are looked up directly in
+        the search alias of the requests, as the system identity would see them,
+        fetching only the receiver of each request, since a new request can't
+        be created anyway if one is already open.
+        """
+        communities_to_exclude = set(record.parent.communities.ids)
 
-        open_requests = current_requests_service.search(
-            identity,
-            extra_filter=dsl.query.Bool(
-                "must",
-                must=[
-                    dsl.Q("term", **{"topic.record": id_}),
-                    dsl.Q("term", **{"type": CommunityInclusion.type_id}),
-                    dsl.Q("term", **{"is_open": True}),
-                ],
-            ),
+        open_requests = (
+            RecordsSearchV2(
+                index=current_requests_service.record_cls.index.search_alias
+            )
+            .filter("term", **{"topic.record": id_})
+            .filter("term", type=CommunityInclusion.type_id)
+            .filter("term", is_open=True)
+            .source(["receiver.community"])
         )
-
         # the assumption here is that there should be only a few open requests,
-        # so requests.hits (first page one) should be enough
-        for request in open_requests.hits:
-            communities_to_exclude.append(
-                dsl.Q("term", **{"id": request["receiver"]["community"]})
-            )
-
-        exclusion_filter = dsl.query.Bool("must_not", must_not=communities_to_exclude)
-
-        return exclusion_filter
+        # so the first page of results should be enough
+        for request in open_requests[:100].execute():
+            communities_to_exclude.add(request["receiver"]["community"])
+
+        if not communities_to_exclude:
+            return dsl.Q("match_all")
+        return dsl.query.Bool(
+            must_not=[dsl.Q("terms", id=sorted(communities_to_exclude))]
+        )
 
     def search_suggested_communities(
         self,
@@ -350,9 +353,7 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
 
         self.require_permission(identity, "add_community", record=record)
 
-        communities_filter = self._get_excluded_communities_filter(
-            record, identity, id_
-        )
+        communities_filter = self._get_excluded_communities_filter(record, id_)
 
         if extra_filter is not None:
             communities_filter = communities_filter & extra_filter
@@ -400,22 +401,65 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
 
         return record.parent
 
+    def _get_records(self, record_ids):
+        """Resolve many records and their parents, with one query per table.
+
+        :returns: A dictionary of the resolved records, keyed by PID value.
+        """
+        pid_field = self.record_cls.pid.field
+        pids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == pid_field._pid_type,
+            PersistentIdentifier.pid_value.in_(set(record_ids)),
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+        ).all()
+        records = {
+            record.id: record
+            for record in self.record_cls.get_records([pid.object_uuid for pid in pids])
+        }
+        parents = {
+            parent.id: parent
+            for parent in self.record_cls.parent_record_cls.get_records(
+                {record.model.parent_id for record in records.values()}
+            )
+        }
+
+        resolved = {}
+        for pid in pids:
+            record = records.get(pid.object_uuid)
+            if record is None or record.model.parent_id not in parents:
+                continue
+            pid_field._set_cache(record, pid)
+            record.parent = parents[record.model.parent_id]
+            resolved[pid.pid_value] = record
+        return resolved
+
     @unit_of_work()
     def bulk_add(self, identity, community_id, record_ids, set_default=False, uow=None):
         """Bulk adds records to a community.
 
+        The community is resolved once, the records and their parents are loaded
+        at once, and all the affected records are reindexed in bulk.
+
         :param identity: The identity performing the action.
         :param community_id: The ID of the community.
         :param record_ids: List of record IDs to be added to the community.
         :param set_default: Whether to set the community as default for the added records.
         """
         self.require_permission(identity, "bulk_add")
-        errors = []
+        community = current_communities.service.record_cls.pid.resolve(community_id)
+        parent_community = getattr(community, "parent", None)
+
+        records = self._get_records(record_ids)
         for record_id in record_ids:
-            record = self.record_cls.pid.resolve(record_id)
-            community = current_communities.service.record_cls.pid.resolve(community_id)
+            if record_id not in records:
+                raise PIDDoesNotExistError(
+                    self.record_cls.pid.field._pid_type, record_id
+                )
 
-            set_default = set_default or not record.parent.communities
+        errors = []
+        parents = []
+        for record_id in record_ids:
+            record = records[record_id]
             already_included = community.id in record.parent.communities
             if already_included:
                 errors.append(
@@ -427,7 +471,7 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
                 )
                 continue
 
-            parent_community = getattr(community, "parent", None)
+            default = set_default or not record.parent.communities
             already_in_parent = (
                 parent_community
                 and str(parent_community.id) in record.parent.communities
@@ -436,14 +480,67 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
             if parent_community and not already_in_parent:
                 record.parent.communities.add(parent_community, request=None)
 
-            record.parent.communities.add(community, request=None, default=set_default)
+            record.parent.communities.add(community, request=None, default=default)
+            parents.append(record.parent)
 
-            # Commit and bulk re-index everything
+        # Commit and bulk re-index everything
+        if parents:
             uow.register(
-                ParentRecordCommitOp(
-                    record.parent,
-                    indexer_context={"service": current_rdm_records_service},
-                    bulk_index=True,
+                ParentRecordsBulkCommitOp(parents, current_rdm_records_service)
+            )
+        return errors
+
+    @unit_of_work()
+    def bulk_remove(self, identity, community_id, record_ids, uow=None):
+        """Bulk removes records from a community.
+
+        The records and their parents are loaded at once, and all the affected
+        records are reindexed in a single bulk request.
+
+        :param identity: The identity performing the action.
+        :param community_id: The ID of the community.
+        :param record_ids: List of record IDs to be removed from the community.
+        :returns: The list of errors, for the records which were not removed.
+        """
+        records = self._get_records(record_ids)
+
+        errors = []
+        parents = []
+        for record_id in record_ids:
+            record = records.get(record_id)
+            if record is None:
+                errors.append(
+                    {
+                        "record": record_id,
+                        "message": _("The record does not exist."),
+                    }
+                )
+                continue
+
+            try:
+                self._remove(identity, community_id, record)
+            except (
+                RecordCommunityMissing,
+                PermissionDeniedError,
+                CannotRemoveCommunityError,
+            ) as ex:
+                errors.append(
+                    {
+                        "record": record_id,
+                        "community": community_id,
+                        "message": ex.description,
+                    }
+                )
+                continue
+            parents.append(record.parent)
+
+        if parents:
+            uow.register(
+                ParentRecordsBulkCommitOp(
+                    parents,
+                    current_rdm_records_service,
+                    bulk_index=False,
+                    index_refresh=True,
                 )
             )
         return errors
@@ -7,14 +7,11 @@
 
 """RDM Community Records Service."""
 
-from invenio_i18n import lazy_gettext as _
-from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records_resources.services import (
     LinksTemplate,
     RecordService,
     ServiceSchemaWrapper,
 )
-from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import unit_of_work
 from invenio_search.engine import dsl
 
@@ -100,15 +97,6 @@ class CommunityRecordsService(RecordService):
             links_item_tpl=self.links_item_tpl,
         )
 
-    def _remove(self, community, record, identity):
-        """Remove a community from the record."""
-        data = dict(communities=[dict(id=str(community.id))])
-        _, errors = current_record_communities_service.remove(
-            identity, id_=record.pid.pid_value, data=data
-        )
-
-        return errors
-
     @unit_of_work()
     def delete(self, identity, community_id, data, revision_id=None, uow=None):
         """Remove records from a community."""
@@ -124,26 +112,9 @@ class CommunityRecordsService(RecordService):
             },
             raise_errors=True,
         )
-        records_dict = valid_data["records"]
-
-        for record_dict in records_dict:
-            record_id = record_dict["id"]
-            try:
-                record = self.record_cls.pid.resolve(record_id)
-                errors += self._remove(community, record, identity)
-            except PIDDoesNotExistError:
-                errors.append(
-                    {
-                        "record": record_id,
-                        "message": _("The record does not exist."),
-                    }
-                )
-            except PermissionDeniedError:
-                errors.append(
-                    {
-                        "record": record_id,
-                        "message": _("Permission denied."),
-                    }
-                )
+        record_ids = [record_dict["id"] for record_dict in valid_data["records"]]
 
+        errors += current_record_communities_service.bulk_remove(
+            identity, str(community.id), record_ids, uow=uow
+        )
         return errors
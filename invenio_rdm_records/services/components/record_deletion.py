@@ -11,6 +11,7 @@ from flask import current_app
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_i18n.proxies import current_i18n
 
+from ...proxies import current_rdm_records
 from ...records.systemfields.deletion_status import RecordDeletionStatusEnum
 from ...resources.serializers.csl import (
     CSLJSONSerializer,
@@ -30,7 +31,7 @@ class RecordDeletionComponent(ServiceComponent):
                 "RDM_CITATION_STYLES_DEFAULT", "apa"
             )
 
-            serializer = CSLJSONSerializer()
+            serializer = current_rdm_records.serializers.get(CSLJSONSerializer)
             style = get_style_location(default_citation_style)
             default_citation = get_citation_string(
                 serializer.dump_obj(record),
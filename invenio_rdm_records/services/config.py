@@ -71,6 +71,7 @@ from invenio_rdm_records.records.processors.tiles import TilesProcessor
 
 from ..records import RDMDraft, RDMRecord
 from ..records.api import RDMDraftMediaFiles, RDMRecordMediaFiles
+from ..records.indexers import RDMRecordIndexer
 from . import facets
 from .components import DefaultRecordsComponents
 from .customizations import (
@@ -583,6 +584,10 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     result_list_cls = RDMRecordList
     revision_result_list_cls = RDMRecordRevisionsList
 
+    # Indexers
+    indexer_cls = RDMRecordIndexer
+    draft_indexer_cls = RDMRecordIndexer
+
     default_files_enabled = FromConfig("RDM_DEFAULT_FILES_ENABLED", default=True)
 
     # we disable by default media files. The feature is only available via REST API
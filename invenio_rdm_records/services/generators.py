@@ -12,15 +12,17 @@
 
 import operator
 from collections import namedtuple
-from functools import partial, reduce
+from functools import partial, reduce, wraps
 from itertools import chain
 
-from flask import current_app
+from flask import current_app, g, has_app_context
 from flask_principal import UserNeed
 from invenio_communities.generators import CommunityRoleNeed, CommunityRoles
 from invenio_communities.proxies import current_roles
 from invenio_records_permissions.generators import ConditionalGenerator, Generator
 from invenio_search.engine import dsl
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from ..records import RDMDraft
 from ..records.systemfields.access.grants import Grant
@@ -34,6 +36,80 @@ CommunityInclusionNeed = partial(_Need, "community-inclusion")
 """Defines a need for a community inclusion."""
 
 
+def _get_needs_cache():
+    """Get the needs cache of the current request."""
+    if "rdm_records_needs_cache" not in g:
+        g.rdm_records_needs_cache = {}
+    return g.rdm_records_needs_cache
+
+
+def get_needs_cache_stats():
+    """Get the hit/miss counters of the needs cache of the current request."""
+    return g.setdefault("rdm_records_needs_cache_stats", {"hits": 0, "misses": 0})
+
+
+def clear_needs_cache(*args, **kwargs):
+    """Clear the needs cache of the current request.
+
+    The cache is cleared whenever changes are flushed to the database, as the
+    needs of the records might have changed.
+    """
+    if has_app_context():
+        g.pop("rdm_records_needs_cache", None)
+
+
+event.listen(Session, "after_flush", clear_needs_cache)
+event.listen(Session, "after_soft_rollback", clear_needs_cache)
+
+
+def cached_needs(func):
+    """Memoize the needs/excludes of a generator for the current request.
+
+    The needs are cached per generator, method, record revision (including
+    the revision of its parent) and keyword arguments, so that they are
+    computed once per record even if the same action is checked many times
+    (e.g. for each link of a search hit). Only applies to generators whose
+    needs depend on the record. Calls with unhashable keyword arguments are
+    not cached.
+    """
+
+    @wraps(func)
+    def wrapper(self, record=None, **kwargs):
+        if (
+            record is None
+            or getattr(record, "id", None) is None
+            or not current_app.config.get("RDM_PERMISSION_NEEDS_CACHE_ENABLED", True)
+        ):
+            return func(self, record=record, **kwargs)
+
+        parent = getattr(record, "parent", None)
+        key = (
+            self,
+            func.__name__,
+            type(record),
+            record.id,
+            record.revision_id,
+            getattr(parent, "revision_id", None),
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. a record passed as keyword argument
+            return func(self, record=record, **kwargs)
+
+        cache = _get_needs_cache()
+        stats = get_needs_cache_stats()
+        if key in cache:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+            cache[key] = func(self, record=record, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
 class IfRestricted(ConditionalGenerator):
     """IfRestricted.
 
@@ -180,6 +256,7 @@ class IfRecordDeleted(Generator):
 class RecordOwners(Generator):
     """Allows record owners."""
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Enabling Needs."""
         if record is None:
@@ -203,6 +280,7 @@ class AccessGrant(Generator):
         """Constructor."""
         self._permission = permission
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Enabling needs."""
         if record is None:
@@ -255,6 +333,7 @@ class SecretLinks(Generator):
         """Constructor."""
         self.permission = permission
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if record is None:
@@ -273,6 +352,7 @@ class SecretLinks(Generator):
 class SubmissionReviewer(Generator):
     """Roles for community's reviewers."""
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if record is None or record.parent.review is None:
@@ -296,6 +376,7 @@ class RequestReviewers(Generator):
         """Check if reviewers are enabled."""
         return current_app.config.get("REQUESTS_REVIEWERS_ENABLED", False)
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if not self._reviewers_enabled():
@@ -348,6 +429,7 @@ class RecordCommunitiesAction(CommunityRoles):
                 community_ids.add(n.value)
         return list(community_ids)
 
+    @cached_needs
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if record is None:
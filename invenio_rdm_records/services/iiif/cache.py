@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""IIIF image derivative cache handlers.
+
+The handlers implement the Flask-IIIF ``ImageCache`` interface and can be
+enabled via the ``IIIF_CACHE_HANDLER`` configuration variable, e.g.:
+
+.. code-block:: python
+
+    IIIF_CACHE_HANDLER = "invenio_rdm_records.services.iiif.cache:ImageLRUCache"
+
+A Redis backed handler is already provided by Flask-IIIF
+(``flask_iiif.cache.redis:ImageRedisCache``).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cachelib.file import FileSystemCache
+from flask import current_app
+from flask_iiif.cache.cache import ImageCache
+
+
+class ImageFileSystemCache(ImageCache):
+    """Image cache storing the derivatives on the local filesystem."""
+
+    def __init__(self, app=None):
+        """Initialize the cache."""
+        super().__init__(app=app)
+        app = app or current_app
+        path = Path(app.config["RDM_IIIF_CACHE_FILESYSTEM_PATH"])
+        if not path.is_absolute():
+            # relative paths are resolved against the instance path
+            path = Path(app.instance_path) / path
+        self.cache = FileSystemCache(
+            str(path),
+            threshold=app.config["RDM_IIIF_CACHE_FILESYSTEM_THRESHOLD"],
+        )
+
+    def get(self, key):
+        """Return the key value."""
+        return self.cache.get(key)
+
+    def set(self, key, value, timeout=None):
+        """Cache the object."""
+        timeout = timeout or self.timeout
+        self.cache.set(key, value, timeout=timeout)
+        self.set_last_modification(key, timeout=timeout)
+
+    def get_last_modification(self, key):
+        """Get last modification of cached file."""
+        return self.get(self._last_modification_key_name(key))
+
+    def set_last_modification(self, key, last_modification=None, timeout=None):
+        """Set last modification of cached file."""
+        if not last_modification:
+            last_modification = datetime.now(timezone.utc).replace(microsecond=0)
+        timeout = timeout or self.timeout
+        self.cache.set(
+            self._last_modification_key_name(key), last_modification, timeout=timeout
+        )
+
+    def delete(self, key):
+        """Delete the specific key."""
+        self.cache.delete(key)
+        self.cache.delete(self._last_modification_key_name(key))
+
+    def flush(self):
+        """Flush the cache."""
+        self.cache.clear()
+
+
+class ImageLRUCache(ImageCache):
+    """In-memory image cache evicting the least recently used entries.
+
+    Contrary to the simple cache of Flask-IIIF which limits the number of cached
+    entries, the eviction is based on the total size of the cached values.
+    """
+
+    def __init__(self, app=None):
+        """Initialize the cache."""
+        super().__init__(app=app)
+        app = app or current_app
+        self.max_size = app.config["RDM_IIIF_CACHE_LRU_MAX_SIZE"]
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(value):
+        """Get the (approximate) size of the value in bytes."""
+        if isinstance(value, (bytes, bytearray, str)):
+            return len(value)
+        return 64
+
+    def _pop(self, key):
+        """Remove an entry, without locking."""
+        _, value = self._entries.pop(key)
+        self.size -= self._sizeof(value)
+
+    def get(self, key):
+        """Return the key value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        """Cache the object."""
+        self._set(key, value, timeout=timeout)
+        self.set_last_modification(key, timeout=timeout)
+
+    def _set(self, key, value, timeout=None):
+        """Store the value and evict the least recently used entries if needed."""
+        size = self._sizeof(value)
+        if size > self.max_size:
+            return
+
+        expires = time.time() + (timeout or self.timeout)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (expires, value)
+            self.size += size
+            while self.size > self.max_size:
+                self._pop(next(iter(self._entries)))
+
+    def get_last_modification(self, key):
+        """Get last modification of cached file."""
+        return self.get(self._last_modification_key_name(key))
+
+    def set_last_modification(self, key, last_modification=None, timeout=None):
+        """Set last modification of cached file."""
+        if not last_modification:
+            last_modification = datetime.now(timezone.utc).replace(microsecond=0)
+        self._set(
+            self._last_modification_key_name(key), last_modification, timeout=timeout
+        )
+
+    def delete(self, key):
+        """Delete the specific key."""
+        with self._lock:
+            for k in (key, self._last_modification_key_name(key)):
+                if k in self._entries:
+                    self._pop(k)
+
+    def flush(self):
+        """Flush the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -9,9 +9,12 @@
 
 """IIIF Service."""
 
+import hashlib
 import importlib.metadata as metadata
 import io
+from datetime import datetime, timezone
 
+from flask import current_app
 from flask_iiif.api import IIIFImageAPIWrapper
 from invenio_records_resources.services import Service
 
@@ -81,13 +84,11 @@ class IIIFService(Service):
         )
         return read(identity=identity, id_=id_)
 
-    def _open_image(self, file_):
-        fp = file_.get_stream("rb")
-        # If the file is not a PDF or text, return the file
-        if file_.data["mimetype"] not in {"application/pdf", "text/plain"}:
-            return fp
+    def _rasterize_first_page(self, fp):
+        """Convert the first page of a document to an image.
 
-        # If Wand (ImageMagick) or PyVIPS is installed, extract the first page
+        Returns ``None`` if neither Wand (ImageMagick) nor PyVIPS is installed.
+        """
         if HAS_VIPS:  # prefer PyVIPS since it doesn't load the whole file in memory
 
             def _seek_handler(offset, whence):
@@ -101,19 +102,39 @@ class IIIFService(Service):
             # PyVIPS returns by default the first page of the PDF
             first_page = pyvips.Image.new_from_source(source, "", access="sequential")
             # Convert to memory to be able to return a file-like object
-            first_page_buf = io.BytesIO(first_page.write_to_memory())
-            fp.close()
-            return first_page_buf
+            return io.BytesIO(first_page.write_to_memory())
         elif HAS_IMAGEMAGICK:
             first_page = Image(blob=fp)
             first_page_buf = io.BytesIO()
             with first_page.convert(format="png") as converted:
                 converted.save(file=first_page_buf)
             first_page_buf.seek(0)
-            fp.close()
             return first_page_buf
 
-        return fp
+        return None
+
+    def _open_image(self, file_):
+        # If the file is not a PDF or text, return the file
+        if file_.data["mimetype"] not in {"application/pdf", "text/plain"}:
+            return file_.get_stream("rb")
+
+        # The first page is rendered only once per file content, since the
+        # conversion of the whole document is expensive
+        checksum = file_.data.get("checksum")
+        cache_key = "iiif:first-page:{0}".format(checksum) if checksum else None
+        cached = self._get_cached_image(cache_key)
+        if cached is not None:
+            return io.BytesIO(cached)
+
+        # If Wand (ImageMagick) or PyVIPS is installed, extract the first page
+        fp = file_.get_stream("rb")
+        first_page_buf = self._rasterize_first_page(fp)
+        if first_page_buf is None:
+            return fp
+
+        fp.close()
+        self._set_cached_image(cache_key, first_page_buf)
+        return first_page_buf
 
     def get_file(self, identity, uuid, key=None):
         """Get the file for the given ``uuid``.
@@ -133,6 +154,77 @@ class IIIFService(Service):
         # TODO: add cache and check if the metadata is present
         return service.get_file_content(id_=id_, file_key=key, identity=identity)
 
+    def _image_cache_key(self, file_, region, size, rotation, quality, image_format):
+        """Build the cache key of an image derivative.
+
+        The key is based on the checksum of the original file, so that derivatives
+        are never served for outdated file contents.
+        """
+        checksum = file_.data.get("checksum")
+        if not checksum:
+            return None
+        return "iiif:{0}:{1}:{2}:{3}:{4}.{5}".format(
+            checksum, region, size, rotation, quality, image_format
+        )
+
+    def _get_cached_image(self, cache_key):
+        """Get an image derivative from the cache."""
+        if not cache_key or not current_app.config["RDM_IIIF_IMAGE_CACHE_ENABLED"]:
+            return None
+        try:
+            return current_app.extensions["iiif"].cache.get(cache_key)
+        except Exception:
+            if not current_app.config.get("IIIF_CACHE_IGNORE_ERRORS", False):
+                raise
+            return None
+
+    def _set_cached_image(self, cache_key, to_serve):
+        """Store an image derivative in the cache."""
+        if not cache_key or not current_app.config["RDM_IIIF_IMAGE_CACHE_ENABLED"]:
+            return
+        try:
+            current_app.extensions["iiif"].cache.set(cache_key, to_serve.getvalue())
+        except Exception:
+            if not current_app.config.get("IIIF_CACHE_IGNORE_ERRORS", False):
+                raise
+
+    def image_api_validators(
+        self,
+        identity,
+        uuid,
+        region,
+        size,
+        rotation,
+        quality,
+        image_format,
+    ):
+        """Get the ``ETag`` and ``Last-Modified`` values of an image derivative.
+
+        Only the metadata of the original file is needed for this, which allows to
+        answer conditional requests without processing the image.
+
+        :raises FileKeyNotFoundError: If the record has no file for the ``key``
+        """
+        type_, id_, key = self._iiif_image_uuid(uuid)
+        service = self.file_service(type_)
+        file_ = service.get_file_content(id_=id_, file_key=key, identity=identity)
+
+        etag = None
+        cache_key = self._image_cache_key(
+            file_, region, size, rotation, quality, image_format
+        )
+        if cache_key:
+            etag = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
+
+        last_modified = None
+        if file_.data.get("updated"):
+            last_modified = datetime.fromisoformat(file_.data["updated"])
+            if not last_modified.tzinfo:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            last_modified = last_modified.replace(microsecond=0)
+
+        return etag, last_modified
+
     def image_api(
         self,
         identity,
@@ -159,10 +251,16 @@ class IIIFService(Service):
 
         type_, id_, key = self._iiif_image_uuid(uuid)
         service = self.file_service(type_)
-        # TODO: check cache before this
         file_ = service.get_file_content(id_=id_, file_key=key, identity=identity)
+
+        cache_key = self._image_cache_key(
+            file_, region, size, rotation, quality, image_format
+        )
+        cached = self._get_cached_image(cache_key)
+        if cached is not None:
+            return io.BytesIO(cached)
+
         data = self._open_image(file_)
-        # TODO: include image magic for pdf
         image = IIIFImageAPIWrapper.open_image(data)
         image.apply_api(
             region=region,
@@ -173,4 +271,5 @@ class IIIFService(Service):
         # prepare image to be serve
         to_serve = image.serve(image_format=image_format)
         image.close_image()
+        self._set_cached_image(cache_key, to_serve)
         return to_serve
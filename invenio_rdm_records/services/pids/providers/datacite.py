@@ -10,26 +10,104 @@
 """DataCite DOI Provider."""
 
 import json
+import ssl
 import warnings
 from collections import ChainMap
 from json import JSONDecodeError
 
+import requests
 from datacite import DataCiteRESTClient
 from datacite.errors import (
     DataCiteError,
     DataCiteNoContentError,
     DataCiteNotFoundError,
     DataCiteServerError,
+    HttpError,
 )
+from datacite.request import DataCiteRequest
 from flask import current_app
 from invenio_i18n import lazy_gettext as _
 from invenio_pidstore.models import PIDStatus
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from ....resources.serializers import DataCite43JSONSerializer
 from ....utils import ChainObject
 from .base import PIDProvider
 
 
+class DataCitePooledRequest(DataCiteRequest):
+    """DataCite request sent through a shared HTTP session."""
+
+    def __init__(self, session, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.session = session
+
+    def request(self, url, method="GET", body=None, params=None, headers=None):
+        """Make a request."""
+        params = {**(params or {}), **self.default_params}
+        if self.base_url:
+            url = self.base_url + url
+        if body and isinstance(body, str):
+            body = body.encode("utf-8")
+
+        kwargs = dict(
+            auth=(self.username, self.password),
+            params=params,
+            headers=headers or {},
+        )
+        if method in ("POST", "PUT"):
+            kwargs["data"] = body
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        except (requests.RequestException, ssl.SSLError) as e:
+            raise HttpError(e)
+
+
+class DataCitePooledRESTClient(DataCiteRESTClient):
+    """DataCite REST API client reusing its HTTP connections.
+
+    Contrary to the default client which opens a new connection per request,
+    the requests are sent through a session with a pool of connections.
+    Rate-limited (429) and unavailable (502, 503, 504) responses are retried
+    with an exponential backoff, respecting the ``Retry-After`` header.
+    """
+
+    retry_statuses = (429, 502, 503, 504)
+
+    def __init__(
+        self, *args, pool_maxsize=10, max_retries=5, backoff_factor=0.5, **kwargs
+    ):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _create_request(self):
+        """Create a new request sent through the session."""
+        return DataCitePooledRequest(
+            self.session,
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            timeout=self.timeout,
+        )
+
+
 class DataCiteClient:
     """DataCite Client."""
 
@@ -79,11 +157,14 @@ class DataCiteClient:
         """DataCite REST API client instance."""
         if self._api is None:
             self.check_credentials()
-            self._api = DataCiteRESTClient(
+            self._api = DataCitePooledRESTClient(
                 self.cfg("username"),
                 self.cfg("password"),
                 self.cfg("prefix"),
                 self.cfg("test_mode", True),
+                pool_maxsize=self.cfg("pool_maxsize", 10),
+                max_retries=self.cfg("max_retries", 5),
+                backoff_factor=self.cfg("backoff_factor", 0.5),
             )
         return self._api
 
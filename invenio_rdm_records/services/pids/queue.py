@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Queue of the pending PID registrations and updates."""
+
+import time
+from contextlib import contextmanager
+
+from celery import current_app as current_celery_app
+from kombu import Exchange, Producer, Queue
+from kombu.compat import Consumer
+
+
+class PIDUpdatesQueue:
+    """Message queue of the PIDs to register or update on the remote provider.
+
+    The pending updates are coalesced per record, PID scheme and parent flag
+    when consumed, so that the remote provider is contacted only once per PID
+    and batch, with the latest state of the record.
+    """
+
+    def __init__(self, name):
+        """Constructor."""
+        self.name = name
+        self.mq_exchange = Exchange(name, type="direct", delivery_mode="persistent")
+        self.mq_queue = Queue(name, exchange=self.mq_exchange, routing_key=name)
+
+    def publish(self, recid, scheme, parent=False, retries=0):
+        """Send a PID registration/update to the queue.
+
+        :param retries: Number of times the registration/update already failed.
+        """
+        with current_celery_app.pool.acquire(block=True) as conn:
+            producer = Producer(
+                conn,
+                exchange=self.mq_exchange,
+                routing_key=self.name,
+                auto_declare=True,
+            )
+            producer.publish(
+                {
+                    "recid": recid,
+                    "scheme": scheme,
+                    "parent": parent,
+                    "retries": retries,
+                    "queued_at": time.time(),
+                },
+                declare=[self.mq_queue],
+            )
+
+    def depth(self):
+        """Get the number of messages waiting in the queue."""
+        with current_celery_app.pool.acquire(block=True) as conn:
+            return (
+                self.mq_queue.bind(conn.default_channel).queue_declare().message_count
+            )
+
+    @contextmanager
+    def consume(self, limit):
+        """Consume up to ``limit`` messages from the queue.
+
+        Yields a dictionary of the coalesced updates, mapping each
+        ``(recid, scheme, parent)`` key to the list of its messages (from the
+        oldest to the newest), which have to be acknowledged once processed.
+        """
+        with current_celery_app.pool.acquire(block=True) as conn:
+            consumer = Consumer(
+                connection=conn,
+                queue=self.name,
+                exchange=self.name,
+                routing_key=self.name,
+            )
+            pending = {}
+            for message in consumer.iterqueue(limit=limit):
+                payload = message.decode()
+                key = (payload["recid"], payload["scheme"], payload["parent"])
+                pending.setdefault(key, []).append(message)
+            try:
+                yield pending
+            finally:
+                consumer.close()
+
+
+pid_updates_queue = PIDUpdatesQueue("rdm-records-pids")
+"""Queue of the PIDs to register or update, when batching is enabled."""
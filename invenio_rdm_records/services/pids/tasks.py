@@ -7,10 +7,15 @@
 
 """RDM PIDs Service tasks."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from celery import shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
 
 from ...proxies import current_rdm_records
+from .queue import pid_updates_queue
 
 
 @shared_task(ignore_result=True)
@@ -22,3 +27,99 @@ def register_or_update_pid(recid, scheme, parent=False):
         scheme=scheme,
         parent=parent,
     )
+
+
+def _process_pid_update(key):
+    """Register or update a PID, returning whether it succeeded and the latency."""
+    recid, scheme, parent = key
+    start = time.monotonic()
+    try:
+        register_or_update_pid(recid, scheme, parent=parent)
+        success = True
+    except Exception:
+        current_app.logger.exception(
+            "Failed to register or update PID %s of record %s.", scheme, recid
+        )
+        success = False
+    return success, time.monotonic() - start
+
+
+@shared_task(ignore_result=True)
+def process_pid_updates(batch_size=None):
+    """Register or update the queued PIDs on the remote providers.
+
+    The queued updates are coalesced per record and PID, and processed with up
+    to ``RDM_PIDS_BATCH_CONCURRENCY`` concurrent requests. The failed updates
+    are queued again, up to ``RDM_PIDS_BATCH_MAX_RETRIES`` times.
+
+    :returns: the metrics of the processed batch.
+    """
+    batch_size = batch_size or current_app.config["RDM_PIDS_BATCH_SIZE"]
+    concurrency = current_app.config["RDM_PIDS_BATCH_CONCURRENCY"]
+    max_retries = current_app.config["RDM_PIDS_BATCH_MAX_RETRIES"]
+
+    with pid_updates_queue.consume(batch_size) as pending:
+        received = sum(len(messages) for messages in pending.values())
+        if not received:
+            return {"received": 0}
+
+        now = time.time()
+        queue_latencies = [
+            now - messages[0].decode()["queued_at"] for messages in pending.values()
+        ]
+        if concurrency > 1:
+            app = current_app._get_current_object()
+
+            def process_in_app_context(key):
+                with app.app_context():
+                    return _process_pid_update(key)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(process_in_app_context, pending))
+        else:
+            results = [_process_pid_update(key) for key in pending]
+
+        retried = 0
+        for (key, messages), (success, _) in zip(pending.items(), results):
+            if not success:
+                recid, scheme, parent = key
+                retries = 1 + max(
+                    message.decode().get("retries", 0) for message in messages
+                )
+                if retries > max_retries:
+                    current_app.logger.error(
+                        "Giving up registering or updating PID %s of record %s "
+                        "after %s retries.",
+                        scheme,
+                        recid,
+                        max_retries,
+                    )
+                else:
+                    # queued again before acknowledging, not to lose the update
+                    pid_updates_queue.publish(
+                        recid, scheme, parent=parent, retries=retries
+                    )
+                    retried += 1
+            for message in messages:
+                message.ack()
+
+    failed = sum(1 for success, _ in results if not success)
+    latencies = [latency for _, latency in results]
+    metrics = {
+        "received": received,
+        "coalesced": received - len(pending),
+        "processed": len(pending) - failed,
+        "failed": failed,
+        "retried": retried,
+        "queue_latency_max": max(queue_latencies),
+        "latency_avg": sum(latencies) / len(latencies),
+        "latency_max": max(latencies),
+        "queue_depth": pid_updates_queue.depth(),
+    }
+    current_app.logger.info("Processed queued PID updates: %s", metrics)
+
+    # keep draining the queue if the batch was full
+    if received >= batch_size and metrics["queue_depth"]:
+        process_pid_updates.delay(batch_size=batch_size)
+
+    return metrics
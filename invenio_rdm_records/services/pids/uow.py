@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for PIDs."""
+
+from flask import current_app
+from invenio_records_resources.services.uow import Operation
+
+from .queue import pid_updates_queue
+from .tasks import register_or_update_pid
+
+
+class PIDRegisterOrUpdateOp(Operation):
+    """Register or update a PID on the remote provider, after commit.
+
+    If ``RDM_PIDS_BATCH_ENABLED`` is set, the PID is sent to the batching queue
+    instead of spawning one task per record and PID scheme.
+    """
+
+    def __init__(self, recid, scheme, parent=False):
+        """Initialize the operation."""
+        super().__init__()
+        self._recid = recid
+        self._scheme = scheme
+        self._parent = parent
+
+    def on_post_commit(self, uow):
+        """Queue the registration/update of the PID."""
+        if current_app.config.get("RDM_PIDS_BATCH_ENABLED", False):
+            pid_updates_queue.publish(self._recid, self._scheme, parent=self._parent)
+        else:
+            register_or_update_pid.delay(self._recid, self._scheme, parent=self._parent)
@@ -12,6 +12,7 @@
 from invenio_communities.communities.entity_resolvers import pick_fields
 from invenio_communities.communities.schema import CommunityGhostSchema
 from invenio_communities.proxies import current_communities
+from invenio_records_resources.services.base.links import LinksTemplate
 from invenio_records_resources.services.base.results import (
     ServiceItemResult,
     ServiceListResult,
@@ -21,6 +22,7 @@ from invenio_records_resources.services.records.results import (
     RecordList,
 )
 from invenio_users_resources.proxies import current_user_resources
+from marshmallow_utils.context import context_schema
 
 from .dummy import DummyExpandingService
 
@@ -80,34 +82,102 @@ class GrantSubjectExpandableField(ExpandableField):
 
 
 class RDMRecordList(RecordList):
-    """Record list with custom fields."""
+    """Record list with custom fields.
+
+    The hits of a page are projected with a single schema instance, and their
+    links are expanded with a context shared by the whole page. For exports
+    which only need plain fields, :meth:`source_hits` projects the hits directly
+    from the search source, without loading the records.
+    """
+
+    #: Top-level fields which can be projected directly from the search source,
+    #: i.e. which neither depend on system fields nor on field permissions.
+    source_fields = ("id", "created", "updated", "pids", "metadata", "custom_fields")
+
+    def _links_expander(self):
+        """Get a function expanding the item links with a shared context."""
+        links_tpl = self._links_item_tpl
+        if type(links_tpl) is not LinksTemplate:
+            # custom templates might compute their context differently
+            return lambda record: links_tpl.expand(self._identity, record)
+
+        ctx = {**links_tpl.context, "identity": self._identity}
+        links = links_tpl._links.items()
+
+        def expand(record):
+            return {
+                key: link.expand(record, ctx)
+                for key, link in links
+                if link.should_render(record, ctx)
+            }
+
+        return expand
 
     @property
     def hits(self):
         """Iterator over the hits."""
+        index_name = self._service.record_cls.index._name
+        schema = self._schema.schema()
+        expand_links = self._links_expander() if self._links_item_tpl else None
+
         for hit in self._results:
             # Load dump
             record_dict = hit.to_dict()
 
-            index_name = self._service.record_cls.index._name
             if index_name in hit.meta["index"]:
                 record = self._service.record_cls.loads(record_dict)
             else:
                 record = self._service.draft_cls.loads(record_dict)
 
             # Project the record
-            projection = self._schema.dump(
-                record,
-                context=dict(
-                    identity=self._identity,
-                    record=record,
-                    meta=hit.meta,
-                ),
-            )
-            if self._links_item_tpl:
-                projection["links"] = self._links_item_tpl.expand(
-                    self._identity, record
+            token = context_schema.set(
+                self._schema._build_context(
+                    dict(identity=self._identity, record=record, meta=hit.meta)
                 )
+            )
+            try:
+                projection = schema.dump(record)
+            finally:
+                context_schema.reset(token)
+
+            if expand_links:
+                projection["links"] = expand_links(record)
+
+            yield projection
+
+    def source_hits(self, fields):
+        """Iterator over the hits, projected directly from the search source.
+
+        The records are neither loaded nor dumped through the service schema, and
+        the projections don't include links.
+
+        :param fields: List of dotted paths to project (e.g. ``metadata.title``),
+            which must belong to the ``source_fields``. Lists are projected as
+            a whole, e.g. ``metadata.creators.person_or_org.name`` projects all
+            of ``metadata.creators``.
+        """
+        paths = [field.split(".") for field in fields]
+        for path in paths:
+            if path[0] not in self.source_fields:
+                raise ValueError(f"Field cannot be projected from source: {path[0]}")
+
+        for hit in self._results:
+            source = hit.to_dict()
+            projection = {}
+            for path in paths:
+                value = source
+                for depth, key in enumerate(path, start=1):
+                    value = value.get(key) if isinstance(value, dict) else None
+                    if isinstance(value, list):
+                        break
+                if value is None:
+                    continue
+
+                *parents, last = path[:depth]
+                target = projection
+                for key in parents:
+                    target = target.setdefault(key, {})
+                target[last] = value
 
             yield projection
 
@@ -118,23 +188,36 @@ class RDMRecordRevisionsList(ServiceListResult):
     We need a custom result class to handle the record revisions list as they are stored only in DB.
     """
 
-    def __init__(self, identity, revisions):
-        """Instantiate a Collection tree list item."""
+    def __init__(self, identity, revisions, include_json=True, total=None):
+        """Instantiate a record revisions list.
+
+        :param revisions: The revisions, e.g. a (paginated) query over them.
+        :param include_json: Whether to serialize the JSON of the revisions.
+        :param total: The total number of revisions of the record.
+        """
         self._identity = identity
         self._revisions = revisions
+        self._include_json = include_json
+        self._total = total
+
+    @property
+    def total(self):
+        """Get the total number of revisions of the record."""
+        return self._total
 
     def to_dict(self):
-        """Serialize the collection tree list to a dictionary."""
-        res = map(
-            lambda revision: {
+        """Serialize the record revisions list to a list of dictionaries."""
+        res = []
+        for revision in self._revisions:
+            revision_dict = {
                 "updated": revision.updated,
                 "created": revision.created,
                 "revision_id": revision.transaction_id,
-                "json": revision.json,
-            },
-            self._revisions,
-        )
-        return list(res)
+            }
+            if self._include_json:
+                revision_dict["json"] = revision.json
+            res.append(revision_dict)
+        return res
 
     def __iter__(self):
         """Iterate over the collection revisions."""
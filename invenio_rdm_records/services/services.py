@@ -15,7 +15,7 @@
 from datetime import datetime
 
 import arrow
-from flask import current_app
+from flask import current_app, g, has_app_context, has_request_context
 from invenio_access.permissions import system_identity, system_user_id
 from invenio_accounts.models import User
 from invenio_db import db
@@ -25,21 +25,26 @@ from invenio_i18n import lazy_gettext as _
 from invenio_records_resources.services import LinksTemplate, ServiceSchemaWrapper
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import (
+    RecordBulkIndexOp,
     RecordCommitOp,
     RecordIndexDeleteOp,
     RecordIndexOp,
-    TaskOp,
+    UnitOfWork,
     unit_of_work,
 )
 from invenio_requests.proxies import current_requests_service as requests_service
 from invenio_requests.services.results import EntityResolverExpandableField
 from invenio_search.engine import dsl
 from marshmallow import ValidationError
+from sqlalchemy import event
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy_continuum import version_class
 
+from invenio_rdm_records.records.api import clear_files_quotas_cache
 from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
 from invenio_rdm_records.requests.record_deletion import RecordDeletion
-from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_rdm_records.services.pids.uow import PIDRegisterOrUpdateOp
 
 from ..records.systemfields.deletion_status import RecordDeletionStatusEnum
 from .errors import (
@@ -49,6 +54,35 @@ from .errors import (
     RecordDeletedException,
 )
 from .results import ParentCommunitiesExpandableField
+from .uow import StagingUnitOfWork
+
+
+def _get_identity_map():
+    """Get the identity map of the records resolved in the current request.
+
+    Returns ``None`` outside of requests (e.g. in Celery tasks or CLI commands),
+    whose application context can live long enough to serve outdated records.
+    """
+    if not has_request_context():
+        return None
+    if "rdm_records_identity_map" not in g:
+        g.rdm_records_identity_map = {}
+    return g.rdm_records_identity_map
+
+
+def clear_identity_map(*args, **kwargs):
+    """Clear the identity map of the current request.
+
+    The map is cleared whenever changes are flushed, committed or rolled back,
+    so that modified records are loaded again on their next resolution.
+    """
+    if has_app_context():
+        g.pop("rdm_records_identity_map", None)
+
+
+event.listen(Session, "after_flush", clear_identity_map)
+event.listen(Session, "after_commit", clear_identity_map)
+event.listen(Session, "after_soft_rollback", clear_identity_map)
 
 
 class RDMRecordService(RecordService):
@@ -123,22 +157,35 @@ class RDMRecordService(RecordService):
         Use this method in combination with scan_expired_embargos().
         """
         # Get the record
-        record = self.record_cls.pid.resolve(_id)
+        record = self._resolve(self.record_cls, _id)
 
         # Check permissions
         self.require_permission(identity, "lift_embargo", record=record)
 
+        self._lift_embargo(identity, record, uow, indexer=self.indexer)
+
+    def _lift_embargo(self, identity, record, uow, indexer=None):
+        """Lift the embargo of a resolved record and its draft (if exists).
+
+        The embargoes are checked before anything is registered in the unit of
+        work, so that a record whose embargo cannot be lifted can be skipped.
+        """
         # Modify draft embargo if draft exists and it's the same as the record.
         draft = None
+        lift_draft_embargo = False
         if record.has_draft:
-            draft = self.draft_cls.pid.resolve(_id, registered_only=False)
-            if record.access == draft.access:
-                if not draft.access.lift_embargo():
-                    raise EmbargoNotLiftedError(_id)
-                uow.register(RecordCommitOp(draft, indexer=self.indexer))
+            # The draft shares the UUID and PID of the record, so there is no need
+            # to resolve the PID again.
+            draft = self.draft_cls.get_record(record.id)
+            draft.pid = record.pid
+            lift_draft_embargo = record.access == draft.access
 
         if not record.access.lift_embargo():
-            raise EmbargoNotLiftedError(_id)
+            raise EmbargoNotLiftedError(record.pid.pid_value)
+        if lift_draft_embargo:
+            if not draft.access.lift_embargo():
+                raise EmbargoNotLiftedError(record.pid.pid_value)
+            uow.register(RecordCommitOp(draft, indexer=self.indexer))
 
         # Run components
         self.run_components(
@@ -146,8 +193,8 @@ class RDMRecordService(RecordService):
         )
 
         self._pids.pid_manager.create_and_reserve(record)
-        uow.register(RecordCommitOp(record, indexer=self.indexer))
-        uow.register(TaskOp(register_or_update_pid, record["id"], "doi", parent=False))
+        uow.register(RecordCommitOp(record, indexer=indexer))
+        uow.register(PIDRegisterOrUpdateOp(record["id"], "doi", parent=False))
         # If the record was previously public it will still keep the parent PID
         if not record.parent.pids:
             self._pids.parent_pid_manager.create_and_reserve(record.parent)
@@ -156,9 +203,33 @@ class RDMRecordService(RecordService):
                     record.parent,
                 )
             )
-            uow.register(
-                TaskOp(register_or_update_pid, record["id"], "doi", parent=True)
-            )
+            uow.register(PIDRegisterOrUpdateOp(record["id"], "doi", parent=True))
+
+    def bulk_lift_embargoes(self, identity, ids, chunk_size=100):
+        """Lift the expired embargoes of the given records in chunks.
+
+        Contrary to ``lift_embargo``, the records are not indexed one by one but
+        in bulk per chunk. Records whose embargo cannot be lifted are skipped.
+
+        :returns: the number of records whose embargo was lifted and the number
+            of records that failed.
+        """
+
+        def lift(record, uow):
+            try:
+                self._lift_embargo(identity, record, uow)
+            except EmbargoNotLiftedError as ex:
+                current_app.logger.warning(ex.description)
+                raise
+
+        return self._bulk_records_action(
+            identity,
+            ids,
+            lift,
+            chunk_size,
+            action_name="lift_embargo",
+            skip_errors=(EmbargoNotLiftedError,),
+        )
 
     def scan_expired_embargos(self, identity):
         """Scan for records with an expired embargo."""
@@ -205,6 +276,22 @@ class RDMRecordService(RecordService):
         if record.deletion_status.is_deleted:
             raise DeletionStatusException(record, RecordDeletionStatusEnum.PUBLISHED)
 
+        self._delete_record(identity, record, data, uow, indexer=self.indexer)
+
+        return self.result_item(
+            self,
+            identity,
+            record,
+            links_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            expand=expand,
+        )
+
+    def _delete_record(self, identity, record, data, uow, indexer=None):
+        """(Soft) delete a resolved record.
+
+        :returns: the new latest version of the record, if it changed.
+        """
         # Load tombstone data with the schema
         data, errors = self.schema_tombstone.load(
             data,
@@ -231,29 +318,20 @@ class RDMRecordService(RecordService):
                 new_record_latest_version.versions.set_latest()
 
         # Commit and reindex record
-        uow.register(RecordCommitOp(record, indexer=self.indexer))
+        uow.register(RecordCommitOp(record, indexer=indexer))
 
         # delete associated draft from index
         try:
-            draft = self.draft_cls.pid.resolve(id_)
+            draft = self.draft_cls.pid.resolve(record.pid.pid_value)
             uow.register(RecordIndexDeleteOp(draft, indexer=self.draft_indexer))
         except NoResultFound:
             pass
 
         # Commit and reindex new latest record
         if new_record_latest_version:
-            uow.register(
-                RecordCommitOp(new_record_latest_version, indexer=self.indexer)
-            )
+            uow.register(RecordCommitOp(new_record_latest_version, indexer=indexer))
 
-        return self.result_item(
-            self,
-            identity,
-            record,
-            links_tpl=self.links_item_tpl,
-            expandable_fields=self.expandable_fields,
-            expand=expand,
-        )
+        return new_record_latest_version
 
     @unit_of_work()
     def request_deletion(self, identity, id_, data=None, uow=None, **kwargs):
@@ -363,11 +441,27 @@ class RDMRecordService(RecordService):
         """Restore a record that has been (soft) deleted."""
         record = self.record_cls.pid.resolve(id_)
         if record.deletion_status != RecordDeletionStatusEnum.DELETED:
-            raise DeletionStatusException(RecordDeletionStatusEnum.DELETED, record)
+            raise DeletionStatusException(record, RecordDeletionStatusEnum.DELETED)
 
         # Check permissions
         self.require_permission(identity, "delete", record=record)
 
+        self._restore_record(identity, record, uow, indexer=self.indexer)
+
+        return self.result_item(
+            self,
+            identity,
+            record,
+            links_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            expand=expand,
+        )
+
+    def _restore_record(self, identity, record, uow, indexer=None):
+        """Restore a resolved (soft) deleted record.
+
+        :returns: the previous latest version of the record, if it changed.
+        """
         # Run components
         self.run_components("restore_record", identity, record=record, uow=uow)
 
@@ -384,27 +478,117 @@ class RDMRecordService(RecordService):
             record.versions.set_latest()
 
         # Commit and reindex record
-        uow.register(RecordCommitOp(record, indexer=self.indexer))
+        uow.register(RecordCommitOp(record, indexer=indexer))
 
         # reindex associated draft
         try:
-            draft = self.draft_cls.pid.resolve(id_)
+            draft = self.draft_cls.pid.resolve(record.pid.pid_value)
             uow.register(RecordIndexOp(draft, indexer=self.draft_indexer))
         except NoResultFound:
             pass
 
         # commit and reindex the old latest record
         if latest_record_version and record.id != latest_record_version.id:
-            uow.register(RecordCommitOp(latest_record_version, indexer=self.indexer))
+            uow.register(RecordCommitOp(latest_record_version, indexer=indexer))
+            return latest_record_version
 
-        return self.result_item(
-            self,
-            identity,
-            record,
-            links_tpl=self.links_item_tpl,
-            expandable_fields=self.expandable_fields,
-            expand=expand,
-        )
+    def _bulk_records_action(
+        self,
+        identity,
+        ids,
+        action,
+        chunk_size,
+        action_name="delete",
+        skip_errors=(DeletionStatusException,),
+    ):
+        """Apply an action to records in chunks, reindexing them in bulk.
+
+        Each chunk is processed in its own unit of work, and the affected
+        records are sent to the bulk indexer once the chunk is committed.
+        Each record is processed in a savepoint, so that a failing record is
+        rolled back and logged without affecting the rest of its chunk.
+
+        :param action: Callable ``action(record, uow)`` returning the other
+            record that was affected, if any. It can raise one of the
+            ``skip_errors`` to skip the record, which is reindexed anyway to
+            make sure the search is up-to-date.
+        :param action_name: The permission required on each record.
+        :returns: a tuple with the number of records the action was applied to
+            and the number of records that failed.
+        """
+        ids = list(ids)
+        processed = failed = 0
+        for start in range(0, len(ids), chunk_size):
+            reindex_ids = []
+            with UnitOfWork() as uow:
+                for id_ in ids[start : start + chunk_size]:
+                    # the operations registered for a failing record are dropped
+                    # along with its changes
+                    record_uow = StagingUnitOfWork(uow.session)
+                    try:
+                        with db.session.begin_nested():
+                            record = self.record_cls.pid.resolve(id_)
+                            self.require_permission(
+                                identity, action_name, record=record
+                            )
+                            other_record = action(record, record_uow)
+                    except skip_errors:
+                        reindex_ids.append(record.id)
+                        continue
+                    except Exception:
+                        failed += 1
+                        current_app.logger.exception(
+                            "Bulk %s action failed for a record.",
+                            action_name,
+                            extra={"record_id": id_},
+                        )
+                        continue
+                    record_uow.stage_into(uow)
+                    processed += 1
+                    reindex_ids.append(record.id)
+                    if other_record:
+                        reindex_ids.append(other_record.id)
+                uow.register(RecordBulkIndexOp(reindex_ids, indexer=self.indexer))
+                uow.commit()
+
+            current_app.logger.info(
+                "Processed %s/%s records.", min(start + chunk_size, len(ids)), len(ids)
+            )
+        return processed, failed
+
+    def bulk_delete_records(self, identity, ids, data, chunk_size=100):
+        """(Soft) delete published records in chunks.
+
+        Contrary to ``delete_record``, the records are not indexed one by one
+        but in bulk per chunk. Already deleted records are reindexed.
+
+        :returns: the number of deleted records and of records that failed.
+        """
+
+        def delete(record, uow):
+            if record.deletion_status.is_deleted:
+                raise DeletionStatusException(
+                    record, RecordDeletionStatusEnum.PUBLISHED
+                )
+            return self._delete_record(identity, record, data, uow)
+
+        return self._bulk_records_action(identity, ids, delete, chunk_size)
+
+    def bulk_restore_records(self, identity, ids, chunk_size=100):
+        """Restore (soft) deleted records in chunks.
+
+        Contrary to ``restore_record``, the records are not indexed one by one
+        but in bulk per chunk. Records that are not deleted are reindexed.
+
+        :returns: the number of restored records and of records that failed.
+        """
+
+        def restore(record, uow):
+            if record.deletion_status != RecordDeletionStatusEnum.DELETED:
+                raise DeletionStatusException(record, RecordDeletionStatusEnum.DELETED)
+            return self._restore_record(identity, record, uow)
+
+        return self._bulk_records_action(identity, ids, restore, chunk_size)
 
     @unit_of_work()
     def mark_record_for_purge(self, identity, id_, expand=False, uow=None):
@@ -510,6 +694,24 @@ class RDMRecordService(RecordService):
             **kwargs,
         )
 
+    def scan(
+        self,
+        identity,
+        params=None,
+        search_preference=None,
+        expand=False,
+        **kwargs,
+    ):
+        """Scan for published records matching the querystring."""
+        return super().scan(
+            identity,
+            params,
+            search_preference,
+            expand,
+            permission_action="read_deleted",
+            **kwargs,
+        )
+
     def search_drafts(
         self,
         identity,
@@ -625,10 +827,31 @@ class RDMRecordService(RecordService):
     #
     # Base methods, extended with handling of deleted records
     #
+    def _resolve(self, record_cls, id_, registered_only=True):
+        """Resolve a record or draft by its PID, once per request.
+
+        The resolved records are kept in an identity map for the duration of the
+        request, so that the different read paths reuse the same instance
+        instead of querying the PID and loading the record model again.
+        """
+        key = (record_cls, id_, registered_only)
+        identity_map = _get_identity_map()
+        if identity_map is None:
+            return record_cls.pid.resolve(id_, registered_only=registered_only)
+        if key not in identity_map:
+            identity_map[key] = record_cls.pid.resolve(
+                id_, registered_only=registered_only
+            )
+        return identity_map[key]
+
     def read(self, identity, id_, expand=False, include_deleted=False):
         """Retrieve a record."""
-        record = self.record_cls.pid.resolve(id_)
         result = super().read(identity, id_, expand=expand)
+        record = result._record
+        # reused by the other resolutions of the record in the same request
+        identity_map = _get_identity_map()
+        if identity_map is not None:
+            identity_map[(self.record_cls, id_, True)] = record
 
         if not include_deleted and record.deletion_status.is_deleted:
             raise RecordDeletedException(record, result_item=result)
@@ -652,7 +875,7 @@ class RDMRecordService(RecordService):
         # check that if there is a published deleted record then return 410
         draft = result._record
         if draft.is_published:
-            record = self.record_cls.pid.resolve(id_)
+            record = self._resolve(self.record_cls, id_)
             if record.deletion_status.is_deleted:
                 result = super().read(identity, id_, expand=expand)
                 raise RecordDeletedException(record, result_item=result)
@@ -750,6 +973,7 @@ class RDMRecordService(RecordService):
             self._update_quota(draft_quota, **data)
 
         db.session.add(draft_quota)
+        clear_files_quotas_cache()
 
         # files_attr can be set to "media_files"
         getattr(draft, files_attr).set_quota(
@@ -794,19 +1018,45 @@ class RDMRecordService(RecordService):
             self._update_quota(user_quota, **data)
 
         db.session.add(user_quota)
+        clear_files_quotas_cache()
 
         return True
 
-    def search_revisions(self, identity, id_):
-        """Return a list of record revisions."""
+    def search_revisions(self, identity, id_, page=None, size=None, include_json=True):
+        """Return a list of record revisions, from the newest to the oldest.
+
+        :param page: The page of revisions to return (starting from 1).
+        :param size: The number of revisions per page. If not set, all the
+            revisions are returned.
+        :param include_json: If false, only the revision ids and timestamps are
+            loaded and returned. The JSON of a revision can then be fetched with
+            :meth:`read_revision`.
+        """
         record = self.record_cls.pid.resolve(id_)
         # Check permissions
         self.require_permission(identity, "search_revisions", record=record)
-        revisions = list(reversed(record.model.versions.all()))
+
+        version_cls = version_class(self.record_cls.model_cls)
+        revisions = record.model.versions.order_by(None).order_by(
+            version_cls.transaction_id.desc()
+        )
+        if not include_json:
+            revisions = revisions.options(
+                load_only(
+                    version_cls.transaction_id,
+                    version_cls.created,
+                    version_cls.updated,
+                )
+            )
+        total = revisions.count()
+        if size:
+            revisions = revisions.offset(((page or 1) - 1) * size).limit(size)
 
         return self.config.revision_result_list_cls(
             identity,
             revisions,
+            include_json=include_json,
+            total=total,
         )
 
     def read_revision(self, identity, id_, revision_id, include_previous=False):
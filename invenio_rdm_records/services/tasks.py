@@ -12,8 +12,11 @@ from datetime import datetime, timedelta
 
 from celery import shared_task
 from celery.schedules import crontab
-from flask import current_app
-from invenio_access.permissions import system_identity
+from flask import current_app, g
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user, system_identity
+from invenio_db import db
+from invenio_jobs.errors import TaskExecutionPartialError
 from invenio_search.engine import dsl
 from invenio_search.proxies import current_search_client
 from invenio_search.utils import prefix_index
@@ -22,7 +25,6 @@ from invenio_stats.bookmark import BookmarkAPI
 from invenio_rdm_records.services.signals import post_publish_signal
 
 from ..proxies import current_rdm_records
-from .errors import EmbargoNotLiftedError
 
 # runs every hour at minute 10 for a consistent offset from process and aggregate
 # event statistics.
@@ -39,27 +41,65 @@ StatsRDMReindexTask = {
 
 
 @shared_task(ignore_result=True)
-def update_expired_embargos():
-    """Lift expired embargos."""
+def update_expired_embargos(chunk_size=None):
+    """Lift expired embargos.
+
+    The embargoes are lifted in chunks of ``RDM_EMBARGO_LIFT_CHUNK_SIZE``
+    records, each chunk in its own transaction. A record failing with an
+    unexpected error is rolled back and counted as failed, without affecting
+    the other records. Records whose embargo cannot be lifted yet are skipped.
+
+    :returns: the number of lifted, skipped and failed embargoes.
+    """
     current_app.logger.debug("Updating expired embargoes")
     service = current_rdm_records.records_service
+    chunk_size = chunk_size or current_app.config["RDM_EMBARGO_LIFT_CHUNK_SIZE"]
 
     records = service.scan_expired_embargos(system_identity)
-    lifted_embargoes = 0
-    for record in records.hits:
-        try:
-            current_app.logger.info(f"Lifting embargo for record {record['id']}")
-            service.lift_embargo(_id=record["id"], identity=system_identity)
-            lifted_embargoes += 1
-        except EmbargoNotLiftedError as ex:
-            current_app.logger.warning(ex.description)
-            continue
-    current_app.logger.info(f"Lifted {lifted_embargoes} embargoes")
+    ids = [record["id"] for record in records.source_hits(["id"])]
+    lifted_embargoes, failed_embargoes = service.bulk_lift_embargoes(
+        system_identity, ids, chunk_size=chunk_size
+    )
+    skipped_embargoes = len(ids) - lifted_embargoes - failed_embargoes
+    current_app.logger.info(
+        f"Lifted {lifted_embargoes} embargoes, skipped {skipped_embargoes}, "
+        f"{failed_embargoes} failed"
+    )
+
+    if failed_embargoes:
+        raise TaskExecutionPartialError(
+            message=f"Failed to lift {failed_embargoes} embargoes.",
+            errored_entries_count=failed_embargoes,
+        )
+
+    return {
+        "lifted": lifted_embargoes,
+        "skipped": skipped_embargoes,
+        "failed": failed_embargoes,
+    }
 
 
 @shared_task(ignore_result=True)
-def reindex_stats(stats_indices):
-    """Reindex the documents where the stats have changed."""
+def reindex_stats_chunk(parent_ids):
+    """Reindex all versions of the records with the given parents."""
+    records_q = dsl.Q("terms", parent__id=parent_ids)
+    current_rdm_records.records_service.reindex(
+        params={"allversions": True},
+        identity=system_identity,
+        search_query=records_q,
+    )
+
+
+@shared_task(ignore_result=True)
+def reindex_stats(stats_indices, chunk_size=5000):
+    """Reindex the documents where the stats have changed.
+
+    The updated parents are paged through with a composite aggregation ordered
+    by the (hourly) update time of the statistics, so that only one chunk of
+    parent IDs is fetched at a time. Each chunk is reindexed in a separate
+    task, and the bookmark is moved forward only once the chunk has been handed
+    off, which allows an interrupted run to continue from where it stopped.
+    """
     bm = BookmarkAPI(current_search_client, "stats_reindex", "day")
     last_run = bm.get_bookmark()
     if not last_run:
@@ -68,29 +108,89 @@ def reindex_stats(stats_indices):
     reindex_start_time = datetime.utcnow().isoformat()
     indices = ",".join(map(lambda x: prefix_index(x) + "*", stats_indices))
 
-    all_parents = set()
     query = dsl.Search(
         using=current_search_client,
         index=indices,
-    ).filter({"range": {"updated_timestamp": {"gte": last_run}}})
-
-    for result in query.scan():
-        parent_id = result.parent_recid
-        all_parents.add(parent_id)
-
-    if all_parents:
-        all_parents_list = list(all_parents)
-        step = 10000
-        end = len(list(all_parents))
-        for i in range(0, end, step):
-            records_q = dsl.Q("terms", parent__id=all_parents_list[i : i + step])
-            current_rdm_records.records_service.reindex(
-                params={"allversions": True},
-                identity=system_identity,
-                search_query=records_q,
-            )
+    ).filter(
+        {"range": {"updated_timestamp": {"gte": last_run}}}
+    )[0:0]
+    sources = [
+        {
+            "updated": {
+                "date_histogram": {
+                    "field": "updated_timestamp",
+                    "calendar_interval": "hour",
+                }
+            }
+        },
+        {"parent_recid": {"terms": {"field": "parent_recid"}}},
+    ]
+
+    reindexed = 0
+    after_key = None
+    while True:
+        paged_query = query._clone()
+        composite = {"size": chunk_size, "sources": sources}
+        if after_key:
+            composite["after"] = after_key
+        paged_query.aggs.bucket("parents", "composite", **composite)
+
+        result = paged_query.execute().aggregations.to_dict()["parents"]
+        buckets = result["buckets"]
+        if not buckets:
+            break
+
+        # a parent appears once per hour bucket in which its statistics changed
+        parent_ids = list({bucket["key"]["parent_recid"] for bucket in buckets})
+        reindex_stats_chunk.delay(parent_ids)
+        reindexed += len(parent_ids)
+
+        # all the statistics updated before the last (possibly incomplete) hour
+        # bucket have been taken care of
+        after_key = result.get("after_key", buckets[-1]["key"])
+        last_updated = datetime.utcfromtimestamp(after_key["updated"] / 1000)
+        bm.set_bookmark(last_updated.isoformat())
+
+        if len(buckets) < chunk_size:
+            break
+
     bm.set_bookmark(reindex_start_time)
-    return "%d documents reindexed" % len(all_parents)
+    return "%d documents reindexed" % reindexed
+
+
+@shared_task(ignore_result=True)
+def update_oai_formats(record_ids):
+    """Precompute the OAI-PMH serializations of the given records."""
+    from ..oai import precompute_oai_formats
+
+    # serialize the records the way anonymous harvesters get them
+    identity = g.get("identity")
+    g.identity = AnonymousIdentity()
+    g.identity.provides.add(any_user)
+
+    try:
+        record_cls = current_rdm_records.records_service.record_cls
+        for record in record_cls.get_records(record_ids):
+            # same as the default filter of the OAI-PMH search
+            is_public = record.get("access", {}).get("record") == "public"
+            has_oai_pid = bool(record.get("pids", {}).get("oai"))
+            if record.deletion_status.is_deleted or not is_public or not has_oai_pid:
+                continue
+            try:
+                precompute_oai_formats(record)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                current_app.logger.exception(
+                    "Failed to precompute the OAI-PMH formats of a record.",
+                    extra={"record_id": str(record.id)},
+                )
+    finally:
+        # the task might run eagerly, within a request
+        if identity is None:
+            g.pop("identity", None)
+        else:
+            g.identity = identity
 
 
 @shared_task(ignore_result=True)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for RDM records."""
+
+from invenio_db import db
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+
+
+class ParentRecordsBulkCommitOp(Operation):
+    """Commit many parent records and reindex all their records and drafts.
+
+    Contrary to registering one ``ParentRecordCommitOp`` per parent, the records
+    and drafts of all the parents are fetched with one query each, and reindexed
+    at once after the transaction commit.
+    """
+
+    def __init__(self, parents, service, bulk_index=True, index_refresh=False):
+        """Initialize the operation.
+
+        :param parents: The parent records to commit.
+        :param service: The records service, providing the record and draft
+            classes and indexers.
+        :param bulk_index: If ``True``, the records are sent to the bulk indexing
+            queue. Otherwise, they are indexed synchronously in a single bulk
+            request.
+        :param index_refresh: Refresh the indices after a synchronous indexing.
+        """
+        super().__init__()
+        self._parents = list({parent.id: parent for parent in parents}.values())
+        self._service = service
+        self._bulk_index = bulk_index
+        self._index_refresh = index_refresh
+
+    def _get_ids(self, record_cls):
+        """Get the ids of the (non-deleted) records of the parents."""
+        model_cls = record_cls.model_cls
+        query = db.session.query(model_cls.id).filter(
+            model_cls.parent_id.in_([parent.id for parent in self._parents]),
+            model_cls.is_deleted != True,  # noqa
+        )
+        return [str(id_) for (id_,) in query]
+
+    def on_register(self, uow):
+        """Commit the parent records."""
+        for parent in self._parents:
+            parent.commit()
+
+    def on_post_commit(self, uow):
+        """Reindex the records and drafts of the parents."""
+        if not self._parents:
+            return
+
+        for record_cls, indexer in (
+            (self._service.record_cls, self._service.indexer),
+            (self._service.draft_cls, self._service.draft_indexer),
+        ):
+            ids = self._get_ids(record_cls)
+            if not ids:
+                continue
+            if self._bulk_index:
+                indexer.bulk_index(ids)
+            else:
+                indexer.index_ids(ids)
+                if self._index_refresh:
+                    indexer.refresh()
+
+
+class StagingUnitOfWork(UnitOfWork):
+    """Unit of work collecting operations, to be committed by another one.
+
+    The operations are registered as usual (e.g. the records are committed to
+    the database session), but only run once they are handed over with
+    ``stage_into`` to the unit of work that is eventually committed. It allows
+    to drop the operations of a failing part of a unit of work, together with
+    its changes in a savepoint.
+    """
+
+    def __init__(self, session=None):
+        """Constructor."""
+        super().__init__(session)
+        self.staged_operations = []
+
+    def register(self, op):
+        """Register an operation."""
+        op.on_register(self)
+        self.staged_operations.append(op)
+
+    def stage_into(self, uow):
+        """Hand the registered operations over to another unit of work."""
+        uow.register(StagedOperationsOp(self.staged_operations))
+
+
+class StagedOperationsOp(Operation):
+    """Run operations already registered in a ``StagingUnitOfWork``."""
+
+    def __init__(self, operations):
+        """Initialize the operation."""
+        super().__init__()
+        self._operations = operations
+
+    def on_commit(self, uow):
+        """Run the commit phase of the operations."""
+        for op in self._operations:
+            op.on_commit(uow)
+
+    def on_post_commit(self, uow):
+        """Run the post commit phase of the operations."""
+        for op in self._operations:
+            op.on_post_commit(uow)
+
+    def on_exception(self, uow, exception):
+        """Run the exception phase of the operations."""
+        for op in self._operations:
+            op.on_exception(uow, exception)
+
+    def on_rollback(self, uow):
+        """Run the rollback phase of the operations."""
+        for op in self._operations:
+            op.on_rollback(uow)
+
+    def on_post_rollback(self, uow):
+        """Run the post rollback phase of the operations."""
+        for op in self._operations:
+            op.on_post_rollback(uow)
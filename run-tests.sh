@@ -17,6 +17,9 @@
 #
 # Example for using mysql instead of postgresql:
 #    DB=mysql ./run-tests.sh
+#
+# The benchmarks are skipped by default, run them with:
+#    ./run-tests.sh -m benchmark tests/benchmarks
 
 # Quit on errors
 set -o errexit
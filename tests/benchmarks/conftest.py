@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks fixtures.
+
+The benchmarks are skipped by default (see ``addopts`` in ``setup.cfg``),
+run them explicitly with:
+
+.. code-block:: console
+
+    $ ./run-tests.sh -m benchmark tests/benchmarks
+"""
+
+import pytest
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records import RDMRecord
+
+CORPUS_SIZE = 25
+
+
+def _record_data(idx):
+    """Minimal record data."""
+    return {
+        "pids": {},
+        "access": {
+            "record": "public",
+            "files": "public",
+        },
+        "files": {
+            "enabled": False,
+        },
+        "metadata": {
+            "creators": [
+                {
+                    "person_or_org": {
+                        "family_name": "Brown",
+                        "given_name": "Troy",
+                        "type": "personal",
+                    }
+                },
+                {
+                    "person_or_org": {
+                        "name": "Troy Inc.",
+                        "type": "organizational",
+                    },
+                },
+            ],
+            "publication_date": "2020-06-01",
+            "publisher": "Acme Inc",
+            "resource_type": {"id": "image-photo"},
+            "title": f"Record {idx}",
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def corpus(app, location, resource_type_v):
+    """Published records, shared by the benchmarks of a module.
+
+    The records are created once per module: the ``search_clear`` fixture
+    must not be used by the benchmarks, as it would delete them.
+    """
+    service = current_rdm_records.records_service
+    records = []
+    for idx in range(CORPUS_SIZE):
+        draft = service.create(system_identity, _record_data(idx))
+        records.append(service.publish(system_identity, draft.id))
+    RDMRecord.index.refresh()
+    return records
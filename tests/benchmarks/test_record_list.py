@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks of the projection of search results."""
+
+import pytest
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+
+SOURCE_FIELDS = ["id", "created", "metadata.title", "metadata.publication_date"]
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture()
+def search_result(corpus):
+    """A page of search results."""
+    service = current_rdm_records.records_service
+    result = service.search(system_identity, size=len(corpus))
+    assert result.total == len(corpus)
+    return result
+
+
+def test_project_hits(benchmark, search_result):
+    """Benchmark the projection of the hits through the service schema."""
+    hits = benchmark(lambda: list(search_result.hits))
+    assert len(hits) == search_result.total
+    assert all("links" in hit for hit in hits)
+
+
+def test_project_source_hits(benchmark, search_result):
+    """Benchmark the projection of the hits directly from the search source."""
+    hits = benchmark(lambda: list(search_result.source_hits(SOURCE_FIELDS)))
+    assert len(hits) == search_result.total
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks of the export formats serialization."""
+
+import pytest
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.serializers import (
+    BibtexSerializer,
+    CSLJSONSerializer,
+    CSVRecordSerializer,
+    DataCite43JSONSerializer,
+    DataCite43XMLSerializer,
+    DataPackageSerializer,
+    DCATSerializer,
+    DublinCoreXMLSerializer,
+    FAIRSignpostingProfileLvl2Serializer,
+    GeoJSONSerializer,
+    MARCXMLSerializer,
+    SchemaorgJSONLDSerializer,
+    UIJSONSerializer,
+)
+
+# The string citation serializer is left out, since it reads its arguments
+# from the resource request context.
+SERIALIZERS = [
+    BibtexSerializer,
+    CSLJSONSerializer,
+    CSVRecordSerializer,
+    DataCite43JSONSerializer,
+    DataCite43XMLSerializer,
+    DataPackageSerializer,
+    DCATSerializer,
+    DublinCoreXMLSerializer,
+    FAIRSignpostingProfileLvl2Serializer,
+    GeoJSONSerializer,
+    MARCXMLSerializer,
+    SchemaorgJSONLDSerializer,
+    UIJSONSerializer,
+]
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(
+    "serializer_cls", SERIALIZERS, ids=[cls.__name__ for cls in SERIALIZERS]
+)
+def test_serialize_corpus(app, benchmark, corpus, serializer_cls):
+    """Benchmark the serialization of the corpus to an export format."""
+    serializer = current_rdm_records.serializers.get(serializer_cls)
+    # the registry builds each serializer once
+    assert current_rdm_records.serializers.get(serializer_cls) is serializer
+
+    records = [record.to_dict() for record in corpus]
+    with app.test_request_context():
+        serialized = benchmark(
+            lambda: [serializer.serialize_object(record) for record in records]
+        )
+
+    assert len(serialized) == len(records)
+    if benchmark.stats:
+        benchmark.extra_info["records_per_second"] = (
+            len(records) / benchmark.stats.stats.mean
+        )
@@ -8,6 +8,9 @@
 
 """Tests for the CLI."""
 
+import json
+from concurrent.futures import Future
+
 from invenio_access.permissions import system_identity
 from invenio_communities import current_communities
 from invenio_communities.communities.records.api import Community
@@ -15,9 +18,11 @@ from invenio_communities.members import Member
 from invenio_requests import current_requests_service
 from invenio_requests.records import Request
 
+from invenio_rdm_records import cli
 from invenio_rdm_records.cli import (
     create_records_custom_field,
     custom_field_exists_in_records,
+    rebuild_index,
 )
 from invenio_rdm_records.fixtures.demo import create_fake_community, create_fake_record
 from invenio_rdm_records.fixtures.tasks import (
@@ -142,3 +147,96 @@ def test_create_records_custom_fields(app, location, db, search_clear, cli_runne
     result = cli_runner(custom_field_exists_in_records, "-f", "unknownfield")
     assert result.exit_code == 0
     assert "Field unknownfield does not exist" in result.output
+
+
+def test_rebuild_index_records(
+    running_app, search_clear, cli_runner, record_factory, tmp_path
+):
+    """Assert that the records are reindexed and the checkpoint is resumed."""
+    record = record_factory.create_record(community=None)
+    service = current_rdm_records_service
+    RDMRecord.index.refresh()
+    service.indexer.delete(record)
+    RDMRecord.index.refresh()
+    assert service.search(system_identity, q=f"id:{record['id']}").total == 0
+
+    checkpoint = tmp_path / "checkpoint.json"
+    result = cli_runner(
+        rebuild_index,
+        "--only",
+        "records",
+        "--chunk-size",
+        "1",
+        "--checkpoint",
+        str(checkpoint),
+    )
+    assert result.exit_code == 0
+    assert "records: 1/1" in result.output
+    assert not checkpoint.exists()
+
+    service.indexer.process_bulk_queue()
+    RDMRecord.index.refresh()
+    assert service.search(system_identity, q=f"id:{record['id']}").total == 1
+
+    # already reindexed targets are skipped when resuming
+    checkpoint.write_text(json.dumps({"only": ["records"], "done": ["records"]}))
+    result = cli_runner(rebuild_index, "--resume", "--checkpoint", str(checkpoint))
+    assert result.exit_code == 0
+    assert "Skipping records" in result.output
+    assert "Reindexing vocabularies" not in result.output
+
+
+class _InlineExecutor:
+    """Process pool running the indexing of the chunks in the current process.
+
+    The forked workers would not see the data of the test transaction.
+    """
+
+    def __init__(self, max_workers, mp_context, initializer):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_rebuild_index_records_workers(
+    running_app, search_clear, cli_runner, record_factory, tmp_path, monkeypatch
+):
+    """Assert that the records are indexed directly by the workers."""
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", _InlineExecutor)
+    records = [record_factory.create_record(community=None) for _ in range(3)]
+    service = current_rdm_records_service
+    RDMRecord.index.refresh()
+    for record in records:
+        service.indexer.delete(record)
+    RDMRecord.index.refresh()
+
+    checkpoint = tmp_path / "checkpoint.json"
+    result = cli_runner(
+        rebuild_index,
+        "--only",
+        "records",
+        "--chunk-size",
+        "2",
+        "--workers",
+        "2",
+        "--checkpoint",
+        str(checkpoint),
+    )
+    assert result.exit_code == 0
+    assert "records: 2/3" in result.output
+    assert "records: 3/3" in result.output
+    assert "Failed to index" not in result.output
+
+    # no bulk indexing queue to process
+    RDMRecord.index.refresh()
+    for record in records:
+        assert service.search(system_identity, q=f"id:{record['id']}").total == 1
@@ -8,8 +8,14 @@
 """Tests for the OAI-PMH endpoint."""
 
 import itertools
+from unittest import mock
 
 from flask import url_for
+from invenio_db import db
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.models import RDMRecordOAIFormat
+from invenio_rdm_records.resources.serializers import MARCXMLSerializer
 
 
 def test_identify(running_app, client, search_clear):
@@ -93,3 +99,68 @@ def test_harvest(running_app, client, record_factory, search_clear):
         assert f"<identifier>{oai_id}</identifier>" in resp.text
         if record["id"] == community_record["id"]:
             assert "<setSpec>community-blr</setSpec>" in resp.text
+
+
+def test_harvest_precomputed_formats(
+    running_app, client, record_factory, search_clear, monkeypatch
+):
+    """Test harvesting with the precomputed OAI-PMH formats."""
+    app = running_app.app
+    monkeypatch.setitem(app.config, "RDM_OAI_FORMATS_CACHE_ENABLED", True)
+
+    record = record_factory.create_record(community=None)
+    precomputed = RDMRecordOAIFormat.query.filter_by(record_id=record.id).all()
+    assert {row.metadata_format for row in precomputed} >= {
+        "marcxml_etree",
+        "dublincore_etree",
+        "datacite_etree",
+    }
+
+    oai_id = f"oai:inveniordm:{record['id']}"
+    for metadata_format in app.config["OAISERVER_METADATA_FORMATS"]:
+        url = url_for(
+            "invenio_oaiserver.response",
+            verb="GetRecord",
+            metadataPrefix=metadata_format,
+            identifier=oai_id,
+        )
+        resp = client.get(url)
+        assert resp.status_code == 200
+        assert f"<identifier>{oai_id}</identifier>" in resp.text
+
+    # the stored serialization is served, without serializing the record
+    precomputed = RDMRecordOAIFormat.query.filter_by(
+        record_id=record.id, metadata_format="marcxml_etree"
+    ).one()
+    precomputed.xml = (
+        '<record xmlns="http://www.loc.gov/MARC21/slim">'
+        '<controlfield tag="001">precomputed</controlfield>'
+        "</record>"
+    )
+    db.session.commit()
+    url = url_for(
+        "invenio_oaiserver.response",
+        verb="GetRecord",
+        metadataPrefix="marcxml",
+        identifier=oai_id,
+    )
+    with mock.patch.object(
+        MARCXMLSerializer, "dump_etree", side_effect=AssertionError
+    ) as dump_etree:
+        resp = client.get(url)
+    assert resp.status_code == 200
+    assert "precomputed" in resp.text
+    assert not dump_etree.called
+
+    # the record changed since it was serialized
+    monkeypatch.setitem(app.config, "RDM_OAI_FORMATS_CACHE_ENABLED", False)
+    record.metadata["title"] = "A changed story"
+    record.commit()
+    db.session.commit()
+    current_rdm_records_service.indexer.index(record, arguments={"refresh": True})
+    monkeypatch.setitem(app.config, "RDM_OAI_FORMATS_CACHE_ENABLED", True)
+
+    resp = client.get(url)
+    assert resp.status_code == 200
+    assert "precomputed" not in resp.text
+    assert "A changed story" in resp.text
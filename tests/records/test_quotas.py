@@ -10,6 +10,7 @@ from invenio_access.permissions import system_identity
 from invenio_db import db
 
 from invenio_rdm_records.proxies import current_rdm_records_service as records_service
+from invenio_rdm_records.records.api import resolve_quotas
 from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
 
 
@@ -86,3 +87,28 @@ def test_record_quota(app, identity_simple, minimal_record, location, resource_t
     draft = records_service.new_version(identity_simple, draft.pid.pid_value)._obj
     assert draft.bucket.quota_size == 1337
     assert draft.bucket.max_file_size == 420
+
+
+def test_resolve_quotas(
+    app, identity_simple, minimal_record, location, resource_type_v
+):
+    """Test resolving the quotas of many parents at once."""
+    drafts = [
+        records_service.create(identity_simple, minimal_record)._obj for _ in range(3)
+    ]
+    parents = [draft.parent for draft in drafts]
+    assert resolve_quotas(parents) == {parent.id: None for parent in parents}
+
+    # setting quotas invalidates the cached quotas
+    records_service.set_user_quota(
+        system_identity, identity_simple.id, {"quota_size": 1337, "max_file_size": 420}
+    )
+    records_service.set_quota(
+        system_identity,
+        drafts[0].pid.pid_value,
+        {"quota_size": 2000, "max_file_size": 1000},
+    )
+    quotas = resolve_quotas(parents)
+    assert quotas[parents[0].id] == {"quota_size": 2000, "max_file_size": 1000}
+    assert quotas[parents[1].id] == {"quota_size": 1337, "max_file_size": 420}
+    assert quotas[parents[2].id] == {"quota_size": 1337, "max_file_size": 420}
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the prefetching of record relationships."""
+
+from unittest import mock
+
+from invenio_db import db
+from invenio_vocabularies.records.systemfields.pid import VocabularyPIDFieldContext
+
+from invenio_rdm_records.records.api import RDMDraft
+
+
+def test_relations_prefetch(running_app, minimal_record):
+    """Prefetched relations are dereferenced without resolving each record."""
+    minimal_record["metadata"]["languages"] = [{"id": "eng"}]
+    drafts = [RDMDraft.create(minimal_record).commit() for _ in range(2)]
+    db.session.commit()
+    expected = [RDMDraft.get_record(draft.id).dumps() for draft in drafts]
+    db.session.expire_all()
+
+    RDMDraft.relations.prefetch(
+        RDMDraft.model_cls.query.get(draft.id).json for draft in drafts
+    )
+    try:
+        with mock.patch.object(
+            VocabularyPIDFieldContext, "resolve", side_effect=AssertionError
+        ):
+            dumps = [RDMDraft.get_record(draft.id).dumps() for draft in drafts]
+    finally:
+        RDMDraft.relations.clear_prefetched()
+
+    assert dumps == expected
+    assert dumps[0]["metadata"]["languages"][0]["title"] == {
+        "en": "English",
+        "da": "Engelsk",
+    }
+    assert "title" in dumps[0]["metadata"]["resource_type"]
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the batched fetching of record statistics."""
+
+from unittest import mock
+
+import pytest
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_rdm_records.records.dumpers import StatisticsDumperExt
+from invenio_rdm_records.records.stats import Statistics
+
+EMPTY_STATS = {
+    "views": 0,
+    "unique_views": 0,
+    "downloads": 0,
+    "unique_downloads": 0,
+    "data_volume": 0,
+}
+
+
+@pytest.fixture()
+def published_records(running_app, search_clear, minimal_record):
+    """Two published records."""
+    service = current_rdm_records_service
+    identity = running_app.superuser_identity
+    return [
+        service.publish(identity, service.create(identity, minimal_record).id)
+        for _ in range(2)
+    ]
+
+
+def test_get_records_stats(published_records):
+    """The bulk statistics match the ones fetched per record."""
+    pairs = [(rec["id"], rec["parent"]["id"]) for rec in published_records]
+    # a record without any statistics
+    pairs.append(("nostats", "nostats-parent"))
+
+    stats = Statistics.get_records_stats(pairs)
+
+    assert set(stats) == {recid for recid, _ in pairs}
+    for recid, parent_recid in pairs:
+        assert stats[recid] == Statistics.get_record_stats(
+            recid=recid, parent_recid=parent_recid
+        )
+    assert stats["nostats"] == {
+        "this_version": EMPTY_STATS,
+        "all_versions": EMPTY_STATS,
+    }
+
+
+def test_get_records_stats_merge(running_app):
+    """The views and downloads are merged per record and per parent."""
+    results = {
+        "record-view": (
+            {"a": {"views": 2, "unique_views": 1}},
+            {"p": {"views": 5, "unique_views": 3}},
+        ),
+        "record-download": (
+            {"b": {"downloads": 4, "unique_downloads": 2, "data_volume": 8.0}},
+            {},
+        ),
+    }
+
+    with mock.patch.object(
+        Statistics,
+        "_get_bulk_query_results",
+        side_effect=lambda query_name, *args: results[query_name],
+    ):
+        stats = Statistics.get_records_stats([("a", "p"), ("b", "p"), ("c", "q")])
+
+    assert stats["a"]["this_version"] == {
+        **EMPTY_STATS,
+        "views": 2,
+        "unique_views": 1,
+    }
+    assert stats["b"]["this_version"] == {
+        **EMPTY_STATS,
+        "downloads": 4,
+        "unique_downloads": 2,
+        "data_volume": 8.0,
+    }
+    assert stats["a"]["all_versions"] == stats["b"]["all_versions"]
+    assert stats["a"]["all_versions"] == {
+        **EMPTY_STATS,
+        "views": 5,
+        "unique_views": 3,
+    }
+    assert stats["c"] == {"this_version": EMPTY_STATS, "all_versions": EMPTY_STATS}
+
+
+def test_prefetched_stats_dump(published_records):
+    """Prefetched statistics are dumped without querying them per record."""
+    recid = published_records[0]["id"]
+    parent_recid = published_records[0]["parent"]["id"]
+    record = RDMRecord.pid.resolve(recid)
+    expected = {
+        "this_version": {**EMPTY_STATS, "views": 3},
+        "all_versions": {**EMPTY_STATS, "views": 7},
+    }
+
+    with mock.patch.object(
+        Statistics, "get_records_stats", return_value={recid: expected}
+    ):
+        StatisticsDumperExt.prefetch([(recid, parent_recid)])
+    try:
+        with mock.patch.object(
+            Statistics, "get_record_stats", side_effect=AssertionError
+        ):
+            dump = record.dumps()
+    finally:
+        StatisticsDumperExt.clear_prefetched()
+
+    assert dump["stats"] == expected
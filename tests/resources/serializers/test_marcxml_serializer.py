@@ -10,6 +10,7 @@
 import pytest
 from dateutil.parser import parse
 from invenio_access.permissions import system_identity
+from lxml import etree
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.resources.serializers.marcxml import MARCXMLSerializer
@@ -339,3 +340,14 @@ def test_marcxml_serializer_full_record(db, running_app, updated_full_record):
 """
 
     assert serialized_record == expected_data
+
+
+def test_marcxml_serializer_dump_etree(db, running_app, updated_full_record):
+    """Test that the etree dump matches the serialized record."""
+    serializer = MARCXMLSerializer()
+    root = serializer.dump_etree(updated_full_record)
+
+    assert root.tag == "{http://www.loc.gov/MARC21/slim}record"
+    assert etree.tostring(
+        root, pretty_print=True, xml_declaration=True, encoding="utf-8"
+    ).decode("utf-8") == serializer.serialize_object(updated_full_record)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Serializers registry tests."""
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.serializers import MARCXMLSerializer
+from invenio_rdm_records.resources.serializers.datacite.schema import (
+    get_scheme_datacite,
+)
+
+
+def test_registry_serializers(running_app):
+    """Test that the serializers are built once."""
+    registry = current_rdm_records.serializers
+    serializer = registry.get(MARCXMLSerializer)
+    assert isinstance(serializer, MARCXMLSerializer)
+    assert registry.get(MARCXMLSerializer) is serializer
+
+
+def test_registry_lookup_config_change(running_app, monkeypatch):
+    """Test that the lookups follow the replaced configuration values."""
+    config_name = "RDM_RECORDS_IDENTIFIERS_SCHEMES"
+    schemes = running_app.app.config[config_name]
+    assert get_scheme_datacite("doi", config_name) == "DOI"
+
+    monkeypatch.setitem(
+        running_app.app.config,
+        config_name,
+        {**schemes, "doi": {**schemes["doi"], "datacite": "doi"}},
+    )
+    assert get_scheme_datacite("doi", config_name) == "doi"
+    assert get_scheme_datacite("unknown", config_name, default="X") == "X"
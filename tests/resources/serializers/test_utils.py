@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Serializers helpers tests."""
+
+from unittest import mock
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_vocabularies.proxies import current_service as vocabulary_service
+
+from invenio_rdm_records.resources.serializers.errors import (
+    VocabularyItemNotFoundError,
+)
+from invenio_rdm_records.resources.serializers.utils import (
+    clear_vocabulary_props_cache,
+    get_vocabulary_props,
+)
+
+
+def test_get_vocabulary_props_cache(running_app):
+    """Test that a vocabulary is loaded once for all its items."""
+    clear_vocabulary_props_cache()
+    service = vocabulary_service._get_current_object()
+
+    with mock.patch.object(service, "read_all", wraps=service.read_all) as read_all:
+        props = get_vocabulary_props("resourcetypes", ["props.csl"], "dataset")
+        assert props == {"csl": "dataset"}
+        props = get_vocabulary_props("resourcetypes", ["props.csl"], "image-photo")
+        assert props == {"csl": "graphic"}
+        assert read_all.call_count == 1
+
+        # unknown items are looked up one by one
+        with pytest.raises(VocabularyItemNotFoundError):
+            get_vocabulary_props("resourcetypes", ["props.csl"], "unknown")
+        assert read_all.call_count == 2
+
+
+def test_get_vocabulary_props_cache_invalidation(running_app):
+    """Test that the cache is cleared when a vocabulary item is updated."""
+    get_vocabulary_props("resourcetypes", ["props.csl"], "dataset")
+
+    item = vocabulary_service.read(system_identity, ("resourcetypes", "dataset"))
+    data = {k: item.data[k] for k in ("id", "icon", "props", "title", "tags")}
+    data["props"]["csl"] = "article"
+    data["type"] = "resourcetypes"
+    vocabulary_service.update(system_identity, ("resourcetypes", "dataset"), data)
+    vocabulary_service.indexer.refresh()
+
+    props = get_vocabulary_props("resourcetypes", ["props.csl"], "dataset")
+    assert props == {"csl": "article"}
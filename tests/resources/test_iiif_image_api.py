@@ -317,3 +317,42 @@ def test_iiif_image_api(
         )
         assert response.status_code == 200
         assert response.headers["Content-Disposition"] == f"attachment; filename={name}"
+
+
+def test_iiif_image_api_conditional_requests(
+    running_app, search_clear, client, uploader, headers, minimal_record
+):
+    client = uploader.login(client)
+    file_id = "test_image.png"
+    recid = publish_record_with_images(client, file_id, minimal_record, headers)
+    url = f"/iiif/record:{recid}:{file_id}/full/full/0/default.png"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    data = response.data
+
+    # the derivative is served from the cache
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+    assert response.data == data
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.data
+    # weak comparison, e.g. the ETag was weakened by a compressing proxy
+    response = client.get(url, headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # other parameters result in a different derivative
+    response = client.get(
+        f"/iiif/record:{recid}:{file_id}/full/300,300/0/default.png",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -20,6 +20,7 @@ from invenio_accounts.testutils import login_user_via_session
 from invenio_requests import current_requests_service
 from marshmallow_utils.permissions import FieldPermissionError
 
+from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records import RDMDraft, RDMRecord
 from invenio_rdm_records.requests import CommunitySubmission
 from tests.helpers import login_user, logout_user
@@ -819,6 +820,56 @@ def test_response_handlers(running_app, minimal_record, client_with_login):
         assert 200 == client.get(f"/records", headers=headers).status_code
 
 
+def test_read_conditional_requests(running_app, minimal_record, client_with_login):
+    """Test the ETag and Last-Modified validators of the record read."""
+    headers = {
+        "content-type": "application/json",
+        "accept": "application/json",
+    }
+    client = client_with_login
+    recid = _create_and_publish(client, minimal_record, headers)
+
+    response = client.get(f"/records/{recid}", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert last_modified
+
+    # the client has the current representation
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.data
+    # e.g. the ETag was weakened by a compressing proxy
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": f"W/{etag}"}
+    )
+    assert response.status_code == 304
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # the validators depend on the negotiated format
+    xml_headers = {**headers, "accept": "application/x-dc+xml"}
+    response = client.get(
+        f"/records/{recid}", headers={**xml_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # the validators depend on the identity
+    assert {"Cookie", "Authorization"} <= set(response.vary)
+    logout_user(client)
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
 #
 # DOI API
 #
@@ -996,3 +1047,26 @@ def test_search_internal_notes_fields(
     resp = client.get("/records?q=internal_notes.note:abc")
     assert resp.json["hits"]["total"] == 0
     logout_user(client)
+
+
+def test_search_revisions_paginated(running_app, minimal_record, client, admin):
+    """Test that the total number of revisions is returned for pagination."""
+    service = current_rdm_records_service
+    identity = running_app.superuser_identity
+    draft = service.create(identity, minimal_record)
+    recid = service.publish(identity, draft.id).id
+
+    client = admin.login(client)
+    response = client.get(f"/records/{recid}/revisions")
+    assert response.status_code == 200
+    total = len(response.json)
+    assert total > 1
+    assert response.headers["X-Total-Count"] == str(total)
+
+    response = client.get(
+        f"/records/{recid}/revisions?page=2&size=1&include_json=false"
+    )
+    assert response.status_code == 200
+    assert len(response.json) == 1
+    assert "json" not in response.json[0]
+    assert response.headers["X-Total-Count"] == str(total)
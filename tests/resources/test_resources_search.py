@@ -7,6 +7,9 @@
 
 """Tests record search."""
 
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records.api import RDMRecord
 
 
@@ -67,3 +70,40 @@ def test_advance_record_search(
     assert records[0]["metadata"]["title"] == record_title
 
     uploader.logout(client)
+
+
+def test_export_csv(client, record_community, minimal_record, uploader):
+    """Test the streamed CSV export of the search results."""
+    uploader.login(client)
+    for title in ["First record", "Second record"]:
+        minimal_record["metadata"]["title"] = title
+        record_community.create_record(minimal_record, uploader)
+    RDMRecord.index.refresh()
+
+    res = client.get("/records/export/csv", query_string={"q": "first"})
+    assert res.status_code == 200
+    assert res.mimetype == "text/csv"
+
+    lines = res.get_data(as_text=True).splitlines()
+    assert lines[0].startswith("id,created,pids.doi.identifier,metadata.title")
+    assert len(lines) == 2
+    assert "First record" in lines[1]
+
+
+def test_export_csv_deleted(client, record_community, minimal_record, uploader):
+    """Test that the deleted records are not exported to anonymous users."""
+    minimal_record["metadata"]["title"] = "Deleted record"
+    record = record_community.create_record(minimal_record, uploader)
+    current_rdm_records_service.delete_record(
+        system_identity, record["id"], {"note": "spam"}
+    )
+    RDMRecord.index.refresh()
+
+    res = client.get(
+        "/records/export/csv",
+        query_string={"q": "deleted", "include_deleted": "true"},
+    )
+    assert res.status_code == 200
+    lines = res.get_data(as_text=True).splitlines()
+    assert len(lines) == 1
+    assert record["id"] not in res.get_data(as_text=True)
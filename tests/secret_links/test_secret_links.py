@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 
 from invenio_db import db
 
+from invenio_rdm_records.records.systemfields.access import Links
 from invenio_rdm_records.secret_links.models import SecretLink
 
 
@@ -114,3 +115,27 @@ def test_secret_link_validate_token_expired(app):
         db.session.commit()
 
         assert not link.validate_token(link.token, expected_data={})
+
+
+def test_links_needs(app, monkeypatch):
+    """Check the needs of secret links, and their invalidation."""
+    monkeypatch.setitem(app.config, "RDM_SECRET_LINKS_CACHE_TTL", 60)
+    with app.app_context():
+        _10_mins_ago = datetime.utcnow() - timedelta(minutes=10)
+        view_link = SecretLink.create("view")
+        edit_link = SecretLink.create("edit")
+        expired_link = SecretLink.create("view", expires_at=_10_mins_ago)
+        db.session.commit()
+
+        links = Links([{"id": str(link.id)} for link in (view_link, edit_link)])
+        links.add({"id": str(expired_link.id)})
+        assert links.needs("view") == [view_link.need]
+        assert links.needs("edit") == [edit_link.need]
+        assert links.resolve_all() == [view_link, edit_link, expired_link]
+
+        # updated and revoked links are invalidated
+        edit_link.permission_level = "view"
+        view_link.revoke()
+        db.session.commit()
+        assert links.needs("view") == [edit_link.need]
+        assert links.needs("edit") == []
@@ -19,7 +19,12 @@ from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records.systemfields.deletion_status import (
     RecordDeletionStatusEnum,
 )
-from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_rdm_records.services.pids import tasks
+from invenio_rdm_records.services.pids.queue import pid_updates_queue
+from invenio_rdm_records.services.pids.tasks import (
+    process_pid_updates,
+    register_or_update_pid,
+)
 
 
 @pytest.fixture(scope="module")
@@ -86,6 +91,63 @@ def test_register_pid(
     )
 
 
+def test_process_pid_updates(
+    running_app,
+    search_clear,
+    minimal_record,
+    superuser_identity,
+    mock_datacite_client,
+    monkeypatch,
+):
+    """Queued PID updates are coalesced per record and PID."""
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_BATCH_CONCURRENCY", 1)
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    draft = service.pids.create(superuser_identity, draft.id, "doi")
+    doi = draft["pids"]["doi"]["identifier"]
+    provider = service.pids.pid_manager._get_provider("doi", "datacite")
+    pid = provider.get(pid_value=doi)
+    record = service.record_cls.publish(draft._record)
+    record.pids = {pid.pid_type: {"identifier": pid.pid_value, "provider": "datacite"}}
+    record.metadata = draft["metadata"]
+    record.register()
+    record.commit()
+    pid.reserve()
+
+    mock_datacite_client.api.reset_mock()
+    pid_updates_queue.publish(record["id"], "doi")
+    pid_updates_queue.publish(record["id"], "doi")
+    metrics = process_pid_updates()
+
+    assert metrics["received"] == 2
+    assert metrics["coalesced"] == 1
+    assert metrics["processed"] == 1
+    assert metrics["queue_depth"] == 0
+    assert pid.status == PIDStatus.REGISTERED
+    assert mock_datacite_client.api.public_doi.call_count == 1
+
+
+def test_process_pid_updates_retry(running_app, monkeypatch):
+    """Failed PID updates are queued again, up to the maximum retries."""
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_BATCH_CONCURRENCY", 1)
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_BATCH_MAX_RETRIES", 1)
+    failing_update = mock.Mock(side_effect=Exception("DataCite is down"))
+    monkeypatch.setattr(tasks, "register_or_update_pid", failing_update)
+
+    pid_updates_queue.publish("abcde-fghij", "doi")
+    metrics = process_pid_updates()
+    assert metrics["failed"] == 1
+    assert metrics["retried"] == 1
+    assert metrics["queue_depth"] == 1
+
+    # the retries are exhausted
+    metrics = process_pid_updates()
+    assert metrics["failed"] == 1
+    assert metrics["retried"] == 0
+    assert metrics["queue_depth"] == 0
+    assert failing_update.call_count == 2
+
+
 def test_register_restricted_pid(
     running_app,
     search_clear,
@@ -27,6 +27,7 @@ from invenio_db import db
 from invenio_records_permissions.generators import (
     AnyUser,
     AuthenticatedUser,
+    Generator,
     SystemProcess,
 )
 from invenio_requests import current_requests_service
@@ -40,6 +41,8 @@ from invenio_rdm_records.services.generators import (
     IfRestricted,
     RecordOwners,
     RequestReviewers,
+    cached_needs,
+    get_needs_cache_stats,
 )
 
 
@@ -161,6 +164,51 @@ def test_record_owner(app, mocker):
     assert query_filter.to_dict() == expected_query_filter
 
 
+def test_needs_cache(app):
+    """Test the memoization of the needs per request."""
+    generator = RecordOwners()
+    record = _owned_record()
+    stats = get_needs_cache_stats()
+    hits, misses = stats["hits"], stats["misses"]
+
+    assert generator.needs(record=record) == [UserNeed(16)]
+    assert generator.needs(record=record) == [UserNeed(16)]
+    assert stats["hits"] == hits + 1
+    assert stats["misses"] == misses + 1
+
+    # flushing changes invalidates the cache
+    record.parent.access.owner = {"user": 17}
+    record.parent.commit()
+    db.session.flush()
+    assert generator.needs(record=record) == [UserNeed(17)]
+    assert stats["misses"] == misses + 2
+
+
+class _UserIdNeeds(Generator):
+    """Needs depending on the keyword arguments."""
+
+    @cached_needs
+    def needs(self, record=None, user_id=None, **kwargs):
+        return [UserNeed(user_id)]
+
+
+def test_needs_cache_kwargs(app):
+    """Test that the needs are cached per keyword arguments."""
+    generator = _UserIdNeeds()
+    record = _owned_record()
+    stats = get_needs_cache_stats()
+    misses = stats["misses"]
+
+    assert generator.needs(record=record, user_id=1) == [UserNeed(1)]
+    assert generator.needs(record=record, user_id=2) == [UserNeed(2)]
+    assert generator.needs(record=record, user_id=1) == [UserNeed(1)]
+    assert stats["misses"] == misses + 2
+
+    # unhashable arguments are not cached
+    assert generator.needs(record=record, user_id=3, extra={}) == [UserNeed(3)]
+    assert stats["misses"] == misses + 2
+
+
 def test_request_reviewers(
     draft_for_open_review, open_review_community, service, users
 ):
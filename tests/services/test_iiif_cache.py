@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""IIIF image cache handlers tests."""
+
+import io
+from types import SimpleNamespace
+from unittest import mock
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.services.iiif.cache import ImageLRUCache
+
+
+def test_lru_cache_size_based_eviction(app, monkeypatch):
+    monkeypatch.setitem(app.config, "RDM_IIIF_CACHE_LRU_MAX_SIZE", 1000)
+    cache = ImageLRUCache(app)
+
+    cache.set("a", b"a" * 300)
+    cache.set("b", b"b" * 300)
+    assert cache.get("a") == b"a" * 300
+    assert cache.get_last_modification("a")
+
+    # "b" is the least recently used entry
+    cache.set("c", b"c" * 300)
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a" * 300
+    assert cache.get("c") == b"c" * 300
+    assert cache.size <= 1000
+
+    # values bigger than the cache are not stored
+    cache.set("d", b"d" * 2000)
+    assert cache.get("d") is None
+
+    cache.flush()
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+class _File:
+    """A file of a record, as returned by the file service."""
+
+    def __init__(self, checksum):
+        self.data = {"mimetype": "application/pdf", "checksum": checksum}
+        self.opened = 0
+
+    def get_stream(self, mode):
+        self.opened += 1
+        return io.BytesIO(b"%PDF-1.4")
+
+
+def test_first_page_cache(app, monkeypatch):
+    monkeypatch.setitem(app.config, "RDM_IIIF_IMAGE_CACHE_ENABLED", True)
+    monkeypatch.setitem(
+        app.extensions, "iiif", SimpleNamespace(cache=ImageLRUCache(app))
+    )
+    service = current_rdm_records.iiif_service
+    rasterize = mock.Mock(side_effect=lambda fp: io.BytesIO(b"first page"))
+    monkeypatch.setattr(service, "_rasterize_first_page", rasterize)
+
+    # the first page is rasterized once per file content
+    file_ = _File("md5:abc")
+    assert service._open_image(file_).read() == b"first page"
+    assert service._open_image(_File("md5:abc")).read() == b"first page"
+    assert rasterize.call_count == 1
+    assert file_.opened == 1
+
+    # another content is rasterized again
+    assert service._open_image(_File("md5:def")).read() == b"first page"
+    assert rasterize.call_count == 2
+
+    # without a checksum, the first page is never cached
+    for _ in range(2):
+        assert service._open_image(_File(None)).read() == b"first page"
+    assert rasterize.call_count == 4
@@ -467,3 +467,57 @@ def test_search_sort_verified_enabled(
 
     expected_order = [v_record.id, nv_record.id]
     assert expected_order == [h["id"] for h in hits]
+
+
+def test_read_identity_map(running_app, search_clear, minimal_record):
+    """Test that a record read in a request is reused until it is modified."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+
+    # no identity map outside of requests
+    read = service.read(superuser_identity, record.id)
+    assert service._resolve(service.record_cls, record.id) is not read._record
+
+    with running_app.app.test_request_context():
+        read = service.read(superuser_identity, record.id)
+        assert service._resolve(service.record_cls, record.id) is read._record
+
+        # modifying the record flushes the session and clears the identity map
+        service.edit(superuser_identity, record.id)
+        assert service._resolve(service.record_cls, record.id) is not read._record
+        assert service.read_draft(superuser_identity, record.id).id == record.id
+
+
+def test_search_revisions_paginated(running_app, search_clear, minimal_record):
+    """Test paginating the revisions of a record, with and without their JSON."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+
+    all_revisions = service.search_revisions(superuser_identity, record.id).to_dict()
+    assert len(all_revisions) > 1
+    assert "json" in all_revisions[0]
+    # newest revision first
+    revision_ids = [revision["revision_id"] for revision in all_revisions]
+    assert revision_ids == sorted(revision_ids, reverse=True)
+
+    result = service.search_revisions(
+        superuser_identity, record.id, page=2, size=1, include_json=False
+    )
+    assert result.total == len(all_revisions)
+    assert result.to_dict() == [
+        {
+            "updated": all_revisions[1]["updated"],
+            "created": all_revisions[1]["created"],
+            "revision_id": all_revisions[1]["revision_id"],
+        }
+    ]
+
+    # the JSON of a revision is fetched explicitly
+    revision = service.read_revision(
+        superuser_identity, record.id, all_revisions[1]["revision_id"]
+    ).to_dict()
+    assert revision[0]["json"] == all_revisions[1]["json"]
@@ -264,3 +264,87 @@ def test_record_deletion_of_specific_version(running_app, minimal_record, search
     assert hits[0] == (record_v3.id, 3)
     assert hits[1] == (record_v2.id, 2)
     assert hits[2] == (record_v1.id, 1)
+
+
+def test_bulk_record_deletion(running_app, minimal_record, search_clear):
+    """Test the deletion and restoration of records in bulk."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    records = []
+    for _ in range(3):
+        draft = service.create(superuser_identity, minimal_record)
+        records.append(service.publish(superuser_identity, draft.id))
+    ids = [record.id for record in records]
+
+    # already deleted records are skipped
+    service.delete_record(superuser_identity, ids[0], {"note": "spam"})
+    deleted = service.bulk_delete_records(
+        superuser_identity, ids, {"note": "spam"}, chunk_size=2
+    )
+    assert deleted == (2, 0)
+    for id_ in ids:
+        record = RDMRecord.pid.resolve(id_)
+        assert record.deletion_status == RecordDeletionStatusEnum.DELETED
+        assert record.tombstone.note == "spam"
+
+    # the records are reindexed in bulk
+    service.indexer.process_bulk_queue()
+    RDMRecord.index.refresh()
+    assert service.search(superuser_identity).total == 0
+
+    restored = service.bulk_restore_records(superuser_identity, ids, chunk_size=2)
+    assert restored == (3, 0)
+    for id_ in ids:
+        record = RDMRecord.pid.resolve(id_)
+        assert record.deletion_status == RecordDeletionStatusEnum.PUBLISHED
+        assert record.tombstone is None
+
+    service.indexer.process_bulk_queue()
+    RDMRecord.index.refresh()
+    assert service.search(superuser_identity).total == 3
+
+    # the published records are skipped
+    restored = service.bulk_restore_records(superuser_identity, ids, chunk_size=2)
+    assert restored == (0, 0)
+
+
+def test_bulk_record_deletion_failures(
+    running_app, minimal_record, search_clear, monkeypatch
+):
+    """Test that a failing record doesn't affect the rest of its chunk."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    ids = []
+    for _ in range(4):
+        draft = service.create(superuser_identity, minimal_record)
+        ids.append(service.publish(superuser_identity, draft.id).id)
+    failing_id = ids[2]
+    # a record that doesn't exist, in the middle of the chunk
+    ids.insert(2, "abcde-fghij")
+
+    delete_record = service._delete_record
+
+    def _delete_record(identity, record, data, uow, indexer=None):
+        result = delete_record(identity, record, data, uow, indexer=indexer)
+        if record.pid.pid_value == failing_id:
+            raise RuntimeError("Component failure")
+        return result
+
+    monkeypatch.setattr(service, "_delete_record", _delete_record)
+    result = service.bulk_delete_records(
+        superuser_identity, ids, {"note": "spam"}, chunk_size=len(ids)
+    )
+    assert result == (3, 2)
+
+    # the changes of the failing record are rolled back
+    record = RDMRecord.pid.resolve(failing_id)
+    assert record.deletion_status == RecordDeletionStatusEnum.PUBLISHED
+    assert record.tombstone is None
+    for id_ in ids[:2] + ids[4:]:
+        record = RDMRecord.pid.resolve(id_)
+        assert record.deletion_status == RecordDeletionStatusEnum.DELETED
+
+    service.indexer.process_bulk_queue()
+    RDMRecord.index.refresh()
+    res = service.search(superuser_identity)
+    assert [hit["id"] for hit in res.hits] == [failing_id]
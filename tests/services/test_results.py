@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Service results tests."""
+
+import pytest
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records import RDMRecord
+
+
+@pytest.fixture()
+def search_result(running_app, search_clear, minimal_record):
+    """A page of search results."""
+    service = current_rdm_records.records_service
+    identity = running_app.superuser_identity
+    for _ in range(2):
+        draft = service.create(identity, minimal_record)
+        service.publish(identity, draft.id)
+    RDMRecord.index.refresh()
+    return service.search(identity)
+
+
+def test_source_hits(search_result):
+    """Test that the source projection matches the one of the service schema."""
+    fields = ["id", "metadata.title", "metadata.publication_date"]
+    source_hits = list(search_result.source_hits(fields))
+    assert len(source_hits) == 2
+
+    for source_hit, hit in zip(source_hits, search_result.hits):
+        assert source_hit == {
+            "id": hit["id"],
+            "metadata": {
+                "title": hit["metadata"]["title"],
+                "publication_date": hit["metadata"]["publication_date"],
+            },
+        }
+
+
+def test_source_hits_invalid_field(search_result):
+    """Test that fields depending on system fields can't be projected."""
+    with pytest.raises(ValueError):
+        list(search_result.source_hits(["access.record"]))
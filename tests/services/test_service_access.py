@@ -9,6 +9,7 @@
 
 import pytest
 from invenio_records_resources.services.errors import PermissionDeniedError
+from marshmallow import ValidationError
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.services.errors import GrantExistsError
@@ -212,6 +213,47 @@ def test_create_multiple_grants_one_exists(running_app, minimal_record, users):
     }
 
 
+def test_create_multiple_grants_unknown_subject(
+    running_app, minimal_record, users, roles
+):
+    """Test creating multiple grants where one subject doesn't exist. None added."""
+    # create record
+    superuser_identity = running_app.superuser_identity
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(superuser_identity, minimal_record)
+    record = records_service.publish(superuser_identity, draft.id)
+
+    access_service = records_service.access
+    grants_payload = {
+        "grants": [
+            {
+                "subject": {"type": "user", "id": str(users[0].id)},
+                "permission": "preview",
+            },
+            {
+                "subject": {"type": "role", "id": "test"},
+                "permission": "preview",
+            },
+            {
+                "subject": {"type": "user", "id": "10000000"},
+                "permission": "manage",
+            },
+        ]
+    }
+
+    with pytest.raises(ValidationError):
+        access_service.bulk_create_grants(superuser_identity, record.id, grants_payload)
+
+    grants = access_service.read_all_grants(superuser_identity, record.id)
+    assert grants.to_dict()["hits"]["total"] == 0
+
+    # without the unknown subject, all the grants are created
+    grants_payload["grants"].pop()
+    access_service.bulk_create_grants(superuser_identity, record.id, grants_payload)
+    grants = access_service.read_all_grants(superuser_identity, record.id)
+    assert grants.to_dict()["hits"]["total"] == 2
+
+
 def test_read_grant_by_subjectid_found(running_app, minimal_record, users):
     """Test read grant by user id."""
     # create record
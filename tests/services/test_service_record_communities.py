@@ -9,11 +9,13 @@
 import pytest
 from invenio_access.permissions import system_identity
 from invenio_records_resources.services.errors import PermissionDeniedError
+from invenio_requests import current_request_type_registry, current_requests_service
 
 from invenio_rdm_records.proxies import (
     current_rdm_records_service,
     current_record_communities_service,
 )
+from invenio_rdm_records.requests import CommunityInclusion
 from invenio_rdm_records.services.errors import CommunityAlreadyExists
 
 
@@ -68,3 +70,50 @@ def test_bulk_add_already_in_community(community, uploader, record_factory):
             "message": "Community already included.",
         }
     ]
+
+
+def test_bulk_remove(community, uploader, record_factory):
+    """Test bulk remove functionality."""
+    recs = [
+        record_factory.create_record(uploader=uploader, community=community)
+        for _ in range(2)
+    ]
+    record_ids = [rec["id"] for rec in recs] + ["wrong-id"]
+
+    errors = current_record_communities_service.bulk_remove(
+        system_identity, str(community.id), record_ids
+    )
+
+    assert errors == [{"record": "wrong-id", "message": "The record does not exist."}]
+    for rec in recs:
+        _rec = current_rdm_records_service.record_cls.pid.resolve(rec["id"])
+        assert str(community.id) not in _rec.parent.communities.ids
+
+
+def test_search_suggested_communities_open_request(
+    community, uploader, community_owner, record_factory
+):
+    """Test that communities with an open inclusion request are not suggested."""
+    record = record_factory.create_record(uploader=uploader, community=None)
+
+    def suggested_ids():
+        result = current_record_communities_service.search_suggested_communities(
+            uploader.identity, record["id"]
+        )
+        return {hit["id"] for hit in result.hits}
+
+    assert str(community.id) in suggested_ids()
+
+    # the inclusion request is opened by another user than the record owner
+    request = current_requests_service.create(
+        system_identity,
+        {},
+        current_request_type_registry.lookup(CommunityInclusion.type_id),
+        community._record,
+        creator=community_owner.user,
+        topic=record,
+    )
+    current_requests_service.execute_action(system_identity, request.id, "submit")
+    current_requests_service.record_cls.index.refresh()
+
+    assert str(community.id) not in suggested_ids()
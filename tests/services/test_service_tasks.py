@@ -7,10 +7,18 @@
 
 """Service tasks tests."""
 
+from datetime import datetime, timedelta
+from unittest import mock
+
 import pytest
+from invenio_jobs.errors import TaskExecutionPartialError
+from invenio_search.proxies import current_search_client
+from invenio_search.utils import prefix_index
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records.api import RDMDraft
+from invenio_rdm_records.services import tasks
+from invenio_rdm_records.services.errors import EmbargoNotLiftedError
 from invenio_rdm_records.services.tasks import update_expired_embargos
 
 
@@ -80,3 +88,149 @@ def test_embargo_lift_with_updated_draft(
     assert draft_lifted.access.embargo.active is False
     assert draft_lifted.access.protection.files == "restricted"
     assert draft_lifted.access.protection.record == "public"
+
+
+def test_bulk_lift_embargoes(
+    embargoed_files_record, minimal_record, superuser_identity, search_clear
+):
+    """Test lifting embargoes in chunks, skipping the ones not expired yet."""
+    service = current_rdm_records.records_service
+    minimal_record["access"]["files"] = "restricted"
+    minimal_record["access"]["status"] = "embargoed"
+    minimal_record["access"]["embargo"] = dict(
+        active=True, until="3220-06-01", reason=None
+    )
+    draft = service.create(superuser_identity, minimal_record)
+    not_expired = service.publish(superuser_identity, draft.id)
+
+    result = service.bulk_lift_embargoes(
+        superuser_identity,
+        [embargoed_files_record["id"], not_expired["id"]],
+        chunk_size=1,
+    )
+    assert result == (1, 0)
+
+    record_lifted = service.record_cls.pid.resolve(embargoed_files_record["id"])
+    assert record_lifted.access.embargo.active is False
+    record_not_lifted = service.record_cls.pid.resolve(not_expired["id"])
+    assert record_not_lifted.access.embargo.active is True
+
+    # the bulk indexing is done in the background
+    service.indexer.process_bulk_queue()
+    service.record_cls.index.refresh()
+    assert update_expired_embargos() == {"lifted": 0, "skipped": 0, "failed": 0}
+
+
+def test_embargo_lift_skipped(
+    embargoed_files_record, embargoed_record, search_clear, monkeypatch
+):
+    """Test that an embargo which cannot be lifted yet is not a failure."""
+    service = current_rdm_records.records_service
+    lift_embargo = service._lift_embargo
+
+    def _lift_embargo(identity, record, uow, indexer=None):
+        if record.pid.pid_value == embargoed_record["id"]:
+            raise EmbargoNotLiftedError(record.pid.pid_value)
+        return lift_embargo(identity, record, uow, indexer=indexer)
+
+    monkeypatch.setattr(service, "_lift_embargo", _lift_embargo)
+    result = update_expired_embargos(chunk_size=10)
+    assert result == {"lifted": 1, "skipped": 1, "failed": 0}
+
+
+def test_embargo_lift_unexpected_error(
+    embargoed_files_record, embargoed_record, search_clear, monkeypatch
+):
+    """Test that an unexpected error only fails the embargo of its record."""
+    service = current_rdm_records.records_service
+    lift_embargo = service._lift_embargo
+
+    def _lift_embargo(identity, record, uow, indexer=None):
+        if record.pid.pid_value == embargoed_record["id"]:
+            raise RuntimeError("Component failure")
+        return lift_embargo(identity, record, uow, indexer=indexer)
+
+    monkeypatch.setattr(service, "_lift_embargo", _lift_embargo)
+    with pytest.raises(TaskExecutionPartialError):
+        update_expired_embargos(chunk_size=10)
+
+    record_lifted = service.record_cls.pid.resolve(embargoed_files_record["id"])
+    assert record_lifted.access.embargo.active is False
+    record_failed = service.record_cls.pid.resolve(embargoed_record["id"])
+    assert record_failed.access.embargo.active is True
+
+
+@pytest.fixture()
+def stats_index(running_app):
+    """A statistics aggregation index with updated parents over three hours."""
+    index = prefix_index("stats-reindex-test-2025")
+    bookmarks_index = prefix_index("stats-bookmarks")
+    current_search_client.indices.delete(index=bookmarks_index, ignore_unavailable=True)
+    current_search_client.indices.create(
+        index=index,
+        body={
+            "mappings": {
+                "properties": {
+                    "parent_recid": {"type": "keyword"},
+                    "updated_timestamp": {"type": "date"},
+                }
+            }
+        },
+    )
+
+    hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    updates = [
+        (3, "parent-a"),
+        (3, "parent-b"),
+        (2, "parent-c"),
+        (2, "parent-d"),
+        (1, "parent-a"),
+        (1, "parent-e"),
+    ]
+    for hours_ago, parent_recid in updates:
+        updated = hour - timedelta(hours=hours_ago) + timedelta(minutes=30)
+        current_search_client.index(
+            index=index,
+            body={"parent_recid": parent_recid, "updated_timestamp": updated},
+        )
+    current_search_client.indices.refresh(index=index)
+
+    yield "stats-reindex-test"
+
+    current_search_client.indices.delete(index=index)
+    current_search_client.indices.delete(index=bookmarks_index, ignore_unavailable=True)
+
+
+def test_reindex_stats(stats_index):
+    """Test paging through the updated parents, one reindexing task per page."""
+    with mock.patch.object(tasks.reindex_stats_chunk, "delay") as reindex_chunk:
+        result = tasks.reindex_stats([stats_index], chunk_size=2)
+
+    pages = [sorted(call.args[0]) for call in reindex_chunk.call_args_list]
+    # the parents are deduplicated within a page only
+    assert pages == [
+        ["parent-a", "parent-b"],
+        ["parent-c", "parent-d"],
+        ["parent-a", "parent-e"],
+    ]
+    assert result == "6 documents reindexed"
+
+
+def test_reindex_stats_resume(stats_index):
+    """Test that an interrupted run resumes after the last handed off chunk."""
+    with mock.patch.object(
+        tasks.reindex_stats_chunk, "delay", side_effect=[None, Exception("Lost")]
+    ):
+        with pytest.raises(Exception):
+            tasks.reindex_stats([stats_index], chunk_size=3)
+    current_search_client.indices.refresh(index=prefix_index("stats-bookmarks"))
+
+    # only the hour bucket of the first chunk, which might be incomplete, is
+    # processed again
+    with mock.patch.object(tasks.reindex_stats_chunk, "delay") as reindex_chunk:
+        tasks.reindex_stats([stats_index], chunk_size=3)
+
+    reindexed = {
+        parent_id for call in reindex_chunk.call_args_list for parent_id in call.args[0]
+    }
+    assert reindexed == {"parent-a", "parent-c", "parent-d", "parent-e"}
@@ -38,6 +38,7 @@ def test_alembic(base_app, database):
     assert "rdm_drafts_media_files" in tables
     assert "rdm_records_media_files" in tables
     assert "rdm_records_media_files_version" in tables
+    assert "rdm_records_oai_formats" in tables
 
     # Check that Alembic agrees that there's no further tables to create.
     assert not ext.alembic.compare_metadata()